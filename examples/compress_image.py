@@ -44,17 +44,26 @@ def download_image_to_memory(url):
         sys.exit(1)
 
 
-def main(url, context_length):
+def main(url, context_length, bitwise=False):
     print(f"Downloading image from: {Fore.CYAN}{url}{Style.RESET_ALL}")
     print(f"Using context length: {Fore.CYAN}{context_length}{Style.RESET_ALL}")
 
     image_data = download_image_to_memory(url)
-    bit_length = len(image_data) * BITS_PER_BYTE
 
-    compressed_data = glorious.encode(image_data, bit_length, context_length)
-    decompressed_data = glorious.decode(compressed_data, bit_length, context_length)
+    if bitwise:
+        bit_length = len(image_data) * BITS_PER_BYTE
+        compressed_data, matches = glorious.round_trip(
+            image_data, bit_length, context_length
+        )
+    else:
+        byte_length = len(image_data)
+        compressed_data = glorious.encode_bytes(image_data, context_length)
+        decompressed_data = glorious.decode_bytes(
+            compressed_data, byte_length, context_length
+        )
+        matches = decompressed_data == image_data
 
-    if decompressed_data == image_data:
+    if matches:
         print(
             f"{Fore.GREEN}Success! Decompressed data matches the original.{Style.RESET_ALL}"
         )
@@ -93,6 +102,12 @@ if __name__ == "__main__":
         default=DEFAULT_CONTEXT_LENGTH,
         help=f"Context length for compression (default: {DEFAULT_CONTEXT_LENGTH}, min: {MIN_CONTEXT_LENGTH}, max: {MAX_CONTEXT_LENGTH})",
     )
+    parser.add_argument(
+        "-b",
+        "--bits",
+        action="store_true",
+        help="Code the image bit by bit instead of byte by byte",
+    )
     parser.add_argument(
         "-v", "--verbose", action="store_true", help="Increase output verbosity"
     )
@@ -105,4 +120,4 @@ if __name__ == "__main__":
     if args.verbose:
         print(f"{Fore.BLUE}Verbose mode enabled{Style.RESET_ALL}")
 
-    main(args.url, args.context)
+    main(args.url, args.context, args.bits)
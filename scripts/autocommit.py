@@ -11,16 +11,21 @@ Typical usage example:
   python autocommit.py --amend
   python autocommit.py --review
   python autocommit.py --amend --review
+  python autocommit.py --review --candidates 5
+  python autocommit.py --no-stream
+  python autocommit.py --no-cache
   python autocommit.py --push-to-private
   python autocommit.py --push-to-private --force
 """
 
 import argparse
+import hashlib
+import json
 import os
 import subprocess
 import sys
 import time
-from typing import List
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import openai
 from colorama import Fore, init
@@ -52,6 +57,78 @@ Your first line will be rendered as the title of the commit in plaintext, and th
 - In the message body, use lists with dashes if appropriate.
 """
 
+# Model used to generate commit messages
+OPENAI_MODEL = "o1-mini"
+
+# Number of commit message candidates requested per API call. o1-series
+# models only accept n=1, so more candidates are opt-in via --candidates.
+DEFAULT_NUM_CANDIDATES = 1
+
+# Maximum length of the commit summary line
+MAX_SUMMARY_LENGTH = 50
+
+# Directory holding generated commit messages, keyed by repository state
+COMMIT_MESSAGE_CACHE_DIR = os.path.join(
+    os.getenv("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "glorious",
+    "autocommit",
+)
+
+# Number of cached results kept; older entries are evicted when saving
+MAX_CACHED_COMMIT_MESSAGES = 100
+
+# Common commit verbs in past-tense, gerund or third-person form; a summary
+# starting with one of these is not in the imperative mood
+NON_IMPERATIVE_VERBS = frozenset(
+    {
+        "added",
+        "adding",
+        "adds",
+        "changed",
+        "changing",
+        "changes",
+        "cleaned",
+        "cleaning",
+        "cleans",
+        "created",
+        "creating",
+        "creates",
+        "dropped",
+        "dropping",
+        "drops",
+        "fixed",
+        "fixing",
+        "fixes",
+        "implemented",
+        "implementing",
+        "implements",
+        "improved",
+        "improving",
+        "improves",
+        "moved",
+        "moving",
+        "moves",
+        "refactored",
+        "refactoring",
+        "refactors",
+        "removed",
+        "removing",
+        "removes",
+        "renamed",
+        "renaming",
+        "renames",
+        "replaced",
+        "replacing",
+        "replaces",
+        "updated",
+        "updating",
+        "updates",
+        "used",
+        "using",
+        "uses",
+    }
+)
+
 
 def print_step(message: str) -> None:
     """Print a step message in cyan color."""
@@ -73,8 +150,21 @@ def print_error(message: str) -> None:
     print(f"{Fore.RED}{message}")
 
 
-def get_git_diff_with_function_context(amend: bool = False) -> str:
-    """Retrieves the git diff with function context."""
+def wait_for_git_output(process: "subprocess.Popen[bytes]") -> str:
+    """Waits for a git command started with Popen and returns its output."""
+    output, _ = process.communicate()
+    if process.returncode != 0:
+        print_error(f"Error executing git command: {output.decode('utf-8')}")
+        raise subprocess.CalledProcessError(
+            process.returncode, process.args, output=output
+        )
+    return output.decode("utf-8")
+
+
+def start_git_diff_with_function_context(
+    amend: bool = False,
+) -> "subprocess.Popen[bytes]":
+    """Starts the git diff with function context without waiting for it."""
     try:
         if amend:
             parent_hash = (
@@ -84,19 +174,15 @@ def get_git_diff_with_function_context(amend: bool = False) -> str:
                 .decode("utf-8")
                 .strip()
             )
-            return subprocess.check_output(
-                ["git", "diff", "--function-context", parent_hash],
-                stderr=subprocess.STDOUT,
-            ).decode("utf-8")
+            command = ["git", "diff", "--function-context", parent_hash]
         else:
-            return subprocess.check_output(
-                ["git", "diff", "--cached", "--function-context"],
-                stderr=subprocess.STDOUT,
-            ).decode("utf-8")
+            command = ["git", "diff", "--cached", "--function-context"]
     except subprocess.CalledProcessError as e:
         print_error(f"Error executing git command: {e.output.decode('utf-8')}")
         raise
 
+    return subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+
 
 def get_previous_commits(num_commits: int = 5) -> str:
     """Retrieves the previous commit messages."""
@@ -110,39 +196,199 @@ def get_previous_commits(num_commits: int = 5) -> str:
         raise
 
 
-def generate_commit_message(
-    diff: str, previous_commits: str, amend: bool = False
-) -> str:
-    """Generates a commit message using OpenAI's language model in Google style."""
+def get_repository_state() -> Tuple[str, str]:
+    """Returns the HEAD commit and the tree object of the staged changes."""
+    try:
+        head = (
+            subprocess.check_output(
+                ["git", "rev-parse", "HEAD"], stderr=subprocess.STDOUT
+            )
+            .decode("utf-8")
+            .strip()
+        )
+        tree = (
+            subprocess.check_output(["git", "write-tree"], stderr=subprocess.STDOUT)
+            .decode("utf-8")
+            .strip()
+        )
+    except subprocess.CalledProcessError as e:
+        print_error(f"Error executing git command: {e.output.decode('utf-8')}")
+        raise
+    return head, tree
+
+
+def get_commit_cache_key(head: str, tree: str, amend: bool, num_candidates: int) -> str:
+    """Computes a cache key from the repository state and the request.
+
+    HEAD, the staged tree and the amend flag determine the diff and the
+    previous commits, so together with the model, the number of requested
+    candidates and the prompt template they determine the whole request. The
+    key can therefore be looked up before the diff is computed.
+    """
+    key = hashlib.sha256()
+    for part in (
+        head,
+        tree,
+        str(amend),
+        OPENAI_MODEL,
+        str(num_candidates),
+        COMMIT_MESSAGE_PROMPT,
+    ):
+        key.update(part.encode("utf-8") + b"\0")
+    return key.hexdigest()
+
+
+def load_cached_commit_messages(cache_key: str) -> Optional[List[str]]:
+    """Loads previously generated commit messages, if any."""
+    cache_path = os.path.join(COMMIT_MESSAGE_CACHE_DIR, f"{cache_key}.json")
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            messages = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(messages, list) or not messages:
+        return None
+    return [str(message) for message in messages]
+
+
+def save_cached_commit_messages(cache_key: str, messages: List[str]) -> None:
+    """Stores generated commit messages for reuse on identical re-runs."""
+    cache_path = os.path.join(COMMIT_MESSAGE_CACHE_DIR, f"{cache_key}.json")
+    try:
+        os.makedirs(COMMIT_MESSAGE_CACHE_DIR, exist_ok=True)
+        with open(cache_path, "w", encoding="utf-8") as f:
+            json.dump(messages, f)
+    except OSError as e:
+        print_warning(f"Could not cache commit message: {e}")
+        return
+
+    evict_cached_commit_messages()
+
+
+def evict_cached_commit_messages() -> None:
+    """Removes the least recently written cache entries beyond the limit."""
+    try:
+        entries = [
+            entry
+            for entry in os.scandir(COMMIT_MESSAGE_CACHE_DIR)
+            if entry.name.endswith(".json") and entry.is_file()
+        ]
+        entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+        for entry in entries[MAX_CACHED_COMMIT_MESSAGES:]:
+            os.remove(entry.path)
+    except OSError as e:
+        print_warning(f"Could not evict cached commit messages: {e}")
+
+
+def clean_commit_message(message_content: str) -> str:
+    """Strips whitespace and surrounding triple backticks from a completion."""
+    message_content = message_content.strip()
+
+    # Remove the triple backticks and any surrounding whitespace
+    if message_content.startswith("```") and message_content.endswith("```"):
+        message_content = message_content[3:-3].strip()
+
+    return message_content
+
+
+def score_commit_message(message: str) -> int:
+    """Scores how well a commit message follows the prompt's instructions."""
+    lines = message.splitlines()
+    summary = lines[0] if lines else ""
+
+    score = 0
+    if 0 < len(summary) <= MAX_SUMMARY_LENGTH:
+        score += 2
+    if "```" not in message and "**" not in message:
+        score += 1
+    first_word = summary.split(maxsplit=1)[0].lower() if summary.strip() else ""
+    if first_word and first_word not in NON_IMPERATIVE_VERBS:
+        score += 1
+    if len(lines) < 2 or not lines[1].strip():
+        score += 1
+    return score
+
+
+def collect_streamed_completions(response: Iterable[Any]) -> List[str]:
+    """Collects streamed completions, echoing the first one as it arrives."""
+    parts: Dict[int, List[str]] = {}
+    for chunk in response:
+        for choice in chunk.choices:
+            delta = choice.delta.content
+            if not delta:
+                continue
+            parts.setdefault(choice.index, []).append(delta)
+            if choice.index == 0:
+                sys.stdout.write(delta)
+                sys.stdout.flush()
+    print()
+
+    return ["".join(parts[index]) for index in sorted(parts)]
+
+
+def generate_commit_messages(
+    diff: str,
+    previous_commits: str,
+    amend: bool = False,
+    num_candidates: int = DEFAULT_NUM_CANDIDATES,
+    stream: bool = True,
+) -> List[str]:
+    """Generates candidate commit messages in Google style, best first.
+
+    All candidates come from a single API call, so the diff is only sent and
+    processed once. They are ranked locally by score_commit_message, keeping
+    the model's order among equally scored candidates. When streaming, the
+    first candidate is printed as it is generated.
+    """
     try:
         print_step("Starting OpenAI API call...")
         start_time = time.time()
 
-        response = client.chat.completions.create(
-            model="o1-mini",
-            messages=[
-                {
-                    "role": "user",
-                    "content": COMMIT_MESSAGE_PROMPT.format(
-                        previous_commits=previous_commits, diff=diff
-                    ),
-                },
-            ],
-        )
+        messages = [
+            {
+                "role": "user",
+                "content": COMMIT_MESSAGE_PROMPT.format(
+                    previous_commits=previous_commits, diff=diff
+                ),
+            },
+        ]
+        try:
+            response = client.chat.completions.create(
+                model=OPENAI_MODEL, messages=messages, n=num_candidates, stream=stream
+            )
+        except openai.BadRequestError as e:
+            if num_candidates == 1 or e.param != "n":
+                raise
+            # Some models (e.g. the o1 series) only support a single choice
+            print_warning(
+                f"Model rejected {num_candidates} candidates; requesting one."
+            )
+            response = client.chat.completions.create(
+                model=OPENAI_MODEL, messages=messages, n=1, stream=stream
+            )
+
+        if stream:
+            # The streamed text is only a preview; the committed message is
+            # the best-ranked candidate, which is printed once it is chosen
+            if num_candidates > 1:
+                print_step("Draft (first candidate, before ranking):")
+            else:
+                print_step("Draft:")
+            contents = collect_streamed_completions(response)
+        else:
+            contents = [choice.message.content for choice in response.choices]
 
         end_time = time.time()
         print_success(
             f"OpenAI API call completed in {end_time - start_time:.2f} seconds"
         )
 
-        # Get the raw content of the response
-        message_content = response.choices[0].message.content.strip()
-
-        # Remove the triple backticks and any surrounding whitespace
-        if message_content.startswith("```") and message_content.endswith("```"):
-            message_content = message_content[3:-3].strip()
+        candidates = [clean_commit_message(content) for content in contents if content]
+        if not candidates:
+            raise ValueError("No commit message was generated.")
 
-        return message_content
+        return sorted(candidates, key=score_commit_message, reverse=True)
 
     except Exception as e:
         print_error(f"Error generating commit message: {str(e)}")
@@ -160,6 +406,23 @@ def main() -> None:
     parser.add_argument(
         "--review", action="store_true", help="Open editor for review before committing"
     )
+    parser.add_argument(
+        "--candidates",
+        type=int,
+        default=DEFAULT_NUM_CANDIDATES,
+        help="Number of commit messages to generate and rank "
+        f"(default: {DEFAULT_NUM_CANDIDATES})",
+    )
+    parser.add_argument(
+        "--no-stream",
+        action="store_true",
+        help="Wait for the full response instead of printing it as it arrives",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Generate a new commit message even if one is cached",
+    )
     parser.add_argument(
         "--push-to-private",
         action="store_true",
@@ -171,20 +434,50 @@ def main() -> None:
         help="Force push to private repository (use with caution)",
     )
     args = parser.parse_args()
+    if args.candidates < 1:
+        parser.error("--candidates must be at least 1")
 
     try:
         print_step("Adding all changes to git...")
         subprocess.run(["git", "add", "-A"], check=True)
         print_success("All changes added to git.")
 
-        diff = get_git_diff_with_function_context(args.amend)
-
-        if not diff:
-            print_warning("No changes to commit.")
-            return
+        # Reuse the messages generated for the same staged changes, without
+        # computing the diff again
+        head, tree = get_repository_state()
+        cache_key = get_commit_cache_key(head, tree, args.amend, args.candidates)
+        commit_messages = None
+        if not args.no_cache:
+            commit_messages = load_cached_commit_messages(cache_key)
+            if commit_messages:
+                print_success("Using cached commit message (--no-cache to regenerate).")
+
+        if not commit_messages:
+            # Read the previous commits while git computes the diff
+            diff_process = start_git_diff_with_function_context(args.amend)
+            try:
+                previous_commits = get_previous_commits()
+            except BaseException:
+                # Don't leave the diff running (or blocked on a full pipe)
+                diff_process.kill()
+                diff_process.wait()
+                raise
+            diff = wait_for_git_output(diff_process)
+
+            if not diff:
+                print_warning("No changes to commit.")
+                return
+
+            commit_messages = generate_commit_messages(
+                diff,
+                previous_commits,
+                args.amend,
+                args.candidates,
+                stream=not args.no_stream,
+            )
+            save_cached_commit_messages(cache_key, commit_messages)
 
-        previous_commits = get_previous_commits()
-        commit_message = generate_commit_message(diff, previous_commits, args.amend)
+        commit_message = commit_messages[0]
 
         # Print the generated commit message
         print_step("\nGenerated commit message:")
@@ -192,6 +485,14 @@ def main() -> None:
         print(f"{Fore.WHITE}{commit_message}")
         print_step("---------------------------\n")
 
+        # Show the other candidates so they can be used during review
+        if args.review:
+            for index, alternative in enumerate(commit_messages[1:], start=2):
+                print_step(f"Alternative commit message {index}:")
+                print_step("---------------------------")
+                print(f"{Fore.WHITE}{alternative}")
+                print_step("---------------------------\n")
+
         # Prepare the git command
         git_command: List[str] = ["git", "commit"]
         if args.amend:
@@ -1,12 +1,54 @@
 """Setup script for the glorious package."""
 
+import glob
 import os
+import platform
+import shutil
+import subprocess
 import sys
 import sysconfig
+from concurrent.futures import ThreadPoolExecutor
 from typing import Tuple
 
 from setuptools import Extension, find_packages, setup
 from setuptools.command.build_ext import build_ext
+from setuptools.errors import SetupError
+
+try:
+    from setuptools.modified import newer_group
+except ImportError:  # setuptools < 69
+    from setuptools.dep_util import newer_group
+
+# Import path of the C extension. The module must live inside the glorious
+# package; an extension named plain "glorious" would shadow the package.
+EXTENSION_NAME = "glorious._glorious"
+
+# Workload run against the instrumented extension during a --pgo build. It
+# loads the freshly built module directly and round-trips bit and byte data
+# with short (register) and long (ring buffer) contexts.
+PGO_TRAINING_SCRIPT = """
+import importlib.util
+import random
+import sys
+
+spec = importlib.util.spec_from_file_location("glorious._glorious", sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+
+rng = random.Random(0)
+samples = [
+    bytes(rng.getrandbits(8) for _ in range(1 << 16)),
+    b"The quick brown fox jumps over the lazy dog. " * 4096,
+    bytes(rng.choice(b"\\x00\\x00\\x00\\xff") for _ in range(1 << 16)),
+]
+for data in samples:
+    for context_length in (8, 32, 64, 1000):
+        bit_length = len(data) * 8
+        encoded = module.encode(data, bit_length, context_length)
+        assert module.decode(encoded, bit_length, context_length) == data
+        encoded = module.encode_bytes(data, context_length)
+        assert module.decode_bytes(encoded, len(data), context_length) == data
+"""
 
 
 def get_libraries() -> list[str]:
@@ -20,6 +62,36 @@ def get_libraries() -> list[str]:
     return []
 
 
+def get_arch_compile_args() -> list[str]:
+    """Select instruction-set flags from the GLORIOUS_ARCH environment variable.
+
+    By default no flags are added, so the extension (and any wheel built from
+    it) runs on every CPU the compiler targets by default. Set GLORIOUS_ARCH to
+    opt in to a specific target, e.g. "x86-64-v3" or "armv8.2-a", or "native"
+    for a local build tuned to, and only runnable on, this machine. MSVC takes
+    its own /arch values instead, e.g. "AVX2".
+
+    Returns:
+      A list of compiler flags.
+    """
+    arch = os.environ.get("GLORIOUS_ARCH", "").strip()
+    if not arch or arch.lower() == "none":
+        return []
+    if sys.platform == "win32":
+        if arch.lower() == "native":
+            # MSVC has no native target, and guessing one (e.g. AVX2) would
+            # produce binaries that crash on CPUs without it
+            return []
+        return [f"/arch:{arch}"]
+    if arch.lower() == "native" and platform.machine().lower() in (
+        "arm64",
+        "aarch64",
+    ):
+        # Arm compilers only accept native as a CPU, not an architecture
+        return ["-mcpu=native"]
+    return [f"-march={arch}"]
+
+
 def get_platform_specific_args() -> Tuple[list[str], list[str], list[str], list[str]]:
     """Define platform-specific macros and flags.
 
@@ -39,24 +111,29 @@ def get_platform_specific_args() -> Tuple[list[str], list[str], list[str], list[
     common_compile_args = ["-fPIC", "-std=c11", "-O3", "-flto", "-fvisibility=hidden"]
     common_link_args = ["-flto"]
     common_warning_flags = ["-Wall", "-Wextra"]
+    arch_compile_args = get_arch_compile_args()
 
     if sys.platform == "darwin":
         python_lib = sysconfig.get_config_var("LIBDIR")
         if python_lib:
             extra_link_args.append("-L" + python_lib)
         extra_link_args.extend(["-undefined", "dynamic_lookup"])
-        extra_compile_args.extend(common_compile_args + common_warning_flags)
+        extra_compile_args.extend(
+            common_compile_args + common_warning_flags + arch_compile_args
+        )
         extra_link_args.extend(common_link_args)
     elif sys.platform == "win32":
         python_lib = sysconfig.get_config_var("LIBDIR")
         if python_lib:
             library_dirs.append(python_lib)
             extra_link_args.append(f"/LIBPATH:{python_lib}")
-        extra_compile_args.extend(["/O2", "/W3", "/EHsc", "/GL"])
+        extra_compile_args.extend(["/O2", "/W3", "/EHsc", "/GL"] + arch_compile_args)
         extra_link_args.append("/LTCG")
     else:
         extra_link_args.append("-shared")
-        extra_compile_args.extend(common_compile_args + common_warning_flags)
+        extra_compile_args.extend(
+            common_compile_args + common_warning_flags + arch_compile_args
+        )
         extra_link_args.extend(common_link_args)
         if "-fPIC" not in extra_compile_args:
             extra_compile_args.append("-fPIC")
@@ -76,7 +153,7 @@ def get_extension_module() -> Extension:
     )
 
     return Extension(
-        "glorious._glorious",
+        EXTENSION_NAME,
         sources=[
             os.path.join("src", "glorious", "bindings", "arithmetic_coding_bindings.c"),
             os.path.join("src", "glorious", "c", "src", "arithmetic_coding.c"),
@@ -94,12 +171,96 @@ def get_extension_module() -> Extension:
 class CustomBuildExt(build_ext):
     """Custom build_ext command for macOS rpath and compiler-specific flags."""
 
+    user_options = build_ext.user_options + [
+        ("pgo", None, "build with profile-guided optimization"),
+    ]
+    boolean_options = build_ext.boolean_options + ["pgo"]
+
+    def initialize_options(self) -> None:
+        """Set default values for the command options."""
+        super().initialize_options()
+        self.pgo = False
+
+    def build_extensions(self) -> None:
+        """Build all extensions, compiling their sources in parallel.
+
+        The parallel option only spreads whole extensions across workers, so
+        build_extension_sources also compiles each extension's sources
+        concurrently. Both default to one job per CPU; pass --parallel to
+        override.
+        """
+        if not self.parallel:
+            self.parallel = os.cpu_count() or 1
+        super().build_extensions()
+
+    def build_extension_sources(self, ext: Extension) -> None:
+        """Compile an extension's sources concurrently, then link it.
+
+        Each source is compiled by its own compiler.compile call on a thread
+        pool. The resulting objects are passed to the base build_extension as
+        extra objects, with no sources left to compile, so it only links.
+        MSVC, single-job and single-source builds use the base implementation.
+
+        Args:
+          ext: The extension being built.
+        """
+        jobs = (os.cpu_count() or 1) if self.parallel is True else int(self.parallel)
+        if self.compiler.compiler_type == "msvc" or jobs < 2 or len(ext.sources) < 2:
+            super().build_extension(ext)
+            return
+
+        ext_path = self.get_ext_fullpath(ext.name)
+        if not (self.force or newer_group(ext.sources + ext.depends, ext_path)):
+            self.announce(f"skipping {ext.name!r} extension (up-to-date)", level=1)
+            return
+
+        macros = ext.define_macros + [(undef,) for undef in ext.undef_macros]
+
+        def compile_source(source: str) -> list[str]:
+            return self.compiler.compile(
+                [source],
+                output_dir=self.build_temp,
+                macros=macros,
+                include_dirs=ext.include_dirs,
+                debug=self.debug,
+                extra_postargs=ext.extra_compile_args,
+                depends=ext.depends,
+            )
+
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            objects = [
+                obj
+                for source_objects in executor.map(compile_source, sorted(ext.sources))
+                for obj in source_objects
+            ]
+
+        sources = ext.sources
+        extra_objects = ext.extra_objects
+        force = self.force
+        ext.sources = []
+        ext.extra_objects = objects + extra_objects
+        self.force = True  # The objects are new, so the link must not be skipped
+        try:
+            super().build_extension(ext)
+        finally:
+            ext.sources = sources
+            ext.extra_objects = extra_objects
+            self.force = force
+
     def build_extension(self, ext: Extension) -> None:
         """Build the extension with custom flags.
 
         Args:
           ext: The extension being built.
+
+        Raises:
+          SetupError: If the extension is not glorious._glorious.
         """
+        if ext.name != EXTENSION_NAME:
+            raise SetupError(
+                f"Unexpected extension {ext.name!r}; expected {EXTENSION_NAME!r}"
+            )
+
         if sys.platform == "darwin":
             python_lib = sysconfig.get_config_var("LIBDIR")
             if python_lib:
@@ -112,7 +273,112 @@ class CustomBuildExt(build_ext):
             # For GCC/Clang, you might add more flags or checks
             pass
 
-        super().build_extension(ext)
+        if self.pgo:
+            self.build_extension_with_pgo(ext)
+        else:
+            self.build_extension_sources(ext)
+
+    def get_pgo_compiler_family(self) -> str:
+        """Identify the compiler from its --version output.
+
+        The executable name is not enough: cc is Clang on FreeBSD and on some
+        Linux systems, and GCC and Clang take different profiling flags.
+
+        Returns:
+          "clang" or "gcc".
+
+        Raises:
+          SetupError: If the compiler is neither GCC nor Clang.
+        """
+        compiler = self.compiler.compiler_so[0]
+        try:
+            version = subprocess.run(
+                [compiler, "--version"],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+        except (OSError, subprocess.CalledProcessError) as e:
+            raise SetupError(f"--pgo could not run {compiler!r} --version: {e}") from e
+
+        if "clang" in version.lower():
+            return "clang"
+        if "gcc" in version.lower() or "free software foundation" in version.lower():
+            return "gcc"
+        raise SetupError(
+            f"--pgo supports only GCC and Clang; {compiler!r} was not recognised"
+        )
+
+    def build_extension_with_pgo(self, ext: Extension) -> None:
+        """Build the extension twice, optimizing the second build with a profile.
+
+        The first build is instrumented and exercised with PGO_TRAINING_SCRIPT;
+        the profile it records then guides branch layout and inlining in the
+        final build.
+
+        Args:
+          ext: The extension being built.
+
+        Raises:
+          SetupError: If the compiler is neither MSVC, GCC nor Clang.
+        """
+        if self.compiler.compiler_type == "msvc":
+            self.warn("--pgo is not supported with MSVC; building without it")
+            super().build_extension(ext)
+            return
+
+        profile_dir = os.path.abspath(os.path.join(self.build_temp, "pgo-data"))
+        shutil.rmtree(profile_dir, ignore_errors=True)
+        os.makedirs(profile_dir)
+
+        is_clang = self.get_pgo_compiler_family() == "clang"
+        if is_clang:
+            profile_data = os.path.join(profile_dir, "default.profdata")
+            generate_args = [
+                "-fprofile-instr-generate=" + os.path.join(profile_dir, "%p.profraw")
+            ]
+            use_args = ["-fprofile-instr-use=" + profile_data]
+        else:
+            generate_args = ["-fprofile-generate=" + profile_dir]
+            use_args = ["-fprofile-use=" + profile_dir, "-fprofile-correction"]
+
+        compile_args = list(ext.extra_compile_args)
+        link_args = list(ext.extra_link_args)
+        force = self.force
+        self.force = True  # Both stages must recompile every source
+        try:
+            ext.extra_compile_args = compile_args + generate_args
+            ext.extra_link_args = link_args + generate_args
+            self.build_extension_sources(ext)
+
+            self.announce("running PGO training workload", level=2)
+            subprocess.run(
+                [
+                    sys.executable,
+                    "-c",
+                    PGO_TRAINING_SCRIPT,
+                    self.get_ext_fullpath(ext.name),
+                ],
+                check=True,
+            )
+            if is_clang:
+                llvm_profdata = ["llvm-profdata"]
+                if sys.platform == "darwin":
+                    llvm_profdata = ["xcrun", "llvm-profdata"]
+                subprocess.run(
+                    llvm_profdata
+                    + ["merge", "-output=" + profile_data]
+                    + glob.glob(os.path.join(profile_dir, "*.profraw")),
+                    check=True,
+                )
+
+            ext.extra_compile_args = compile_args + use_args
+            ext.extra_link_args = link_args + use_args
+            self.build_extension_sources(ext)
+        finally:
+            ext.extra_compile_args = compile_args
+            ext.extra_link_args = link_args
+            self.force = force
 
 
 def read_readme() -> str:
@@ -1,5 +1,5 @@
 # glorious/__init__.py
 
-from ._glorious import encode, decode
+from ._glorious import decode, decode_bytes, encode, encode_bytes, round_trip
 
-__all__ = ["encode", "decode"]
+__all__ = ["encode", "decode", "round_trip", "encode_bytes", "decode_bytes"]
@@ -27,35 +27,52 @@ uint32_t get_probability_wrapper(const ContextContent *context_content) {
 }
 
 // Python wrapper for arithmetic_encode with bit length support
-static PyObject *py_arithmetic_encode(PyObject *self, PyObject *args) {
+static PyObject *py_arithmetic_encode(PyObject *self, PyObject *args,
+                                      PyObject *kwargs) {
   (void)self;  // Suppress unused parameter warning
 
-  const char *sequence;
-  Py_ssize_t sequence_length;
+  static char *kwlist[] = {"sequence", "sequence_bit_length", "context_length",
+                           NULL};
+  Py_buffer sequence;
   Py_ssize_t sequence_bit_length;  // New parameter for bit length
   Py_ssize_t context_length;
 
-  // Parse Python arguments (now includes bit length)
-  if (!PyArg_ParseTuple(args, "y#nn", &sequence, &sequence_length,
-                        &sequence_bit_length, &context_length)) {
+  // Parse Python arguments (now includes bit length). Any contiguous buffer
+  // is accepted so callers need not copy bytearrays or memoryviews to bytes.
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "y*nn", kwlist, &sequence,
+                                   &sequence_bit_length, &context_length)) {
     return NULL;
   }
 
   if (context_length <= 0) {
+    PyBuffer_Release(&sequence);
     PyErr_SetString(PyExc_ValueError, "context_length must be positive.");
     return NULL;
   }
 
-  // Call the C arithmetic_encode function with the bit length
+  if (sequence_bit_length < 0 ||
+      (size_t)sequence_bit_length > (size_t)sequence.len * 8) {
+    PyBuffer_Release(&sequence);
+    PyErr_SetString(PyExc_ValueError,
+                    "sequence_bit_length must be between 0 and 8 * "
+                    "len(sequence).");
+    return NULL;
+  }
+
+  // Call the C arithmetic_encode function with the bit length. The coder
+  // touches no Python objects, so release the GIL for the duration.
   uint8_t *encoded_output = NULL;
-  size_t encoded_length = arithmetic_encode(
-      (const uint8_t *)sequence,
+  size_t encoded_length;
+  Py_BEGIN_ALLOW_THREADS
+  encoded_length = arithmetic_encode(
+      (const uint8_t *)sequence.buf,
       (size_t)sequence_bit_length,  // Use the bit length directly
       &encoded_output, (size_t)context_length, get_probability_wrapper);
+  Py_END_ALLOW_THREADS
+  PyBuffer_Release(&sequence);
 
-  if (encoded_length == 0 || encoded_output == NULL) {
-    PyErr_SetString(PyExc_RuntimeError, "Encoding failed.");
-    return NULL;
+  if (encoded_output == NULL) {
+    return PyErr_NoMemory();
   }
 
   PyObject *result =
@@ -65,38 +82,59 @@ static PyObject *py_arithmetic_encode(PyObject *self, PyObject *args) {
 }
 
 // Python wrapper for arithmetic_decode with bit length support
-static PyObject *py_arithmetic_decode(PyObject *self, PyObject *args) {
+static PyObject *py_arithmetic_decode(PyObject *self, PyObject *args,
+                                      PyObject *kwargs) {
   (void)self;  // Suppress unused parameter warning
 
-  const char *encoded;
-  Py_ssize_t encoded_length;
+  static char *kwlist[] = {"encoded", "decoded_bit_length", "context_length",
+                           NULL};
+  Py_buffer encoded;
   Py_ssize_t decoded_bit_length;  // New parameter for decoded bit length
   Py_ssize_t context_length;
 
   // Parse Python arguments (includes decoded bit length)
-  if (!PyArg_ParseTuple(args, "y#nn", &encoded, &encoded_length,
-                        &decoded_bit_length, &context_length)) {
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "y*nn", kwlist, &encoded,
+                                   &decoded_bit_length, &context_length)) {
     return NULL;
   }
 
   if (context_length <= 0) {
+    PyBuffer_Release(&encoded);
     PyErr_SetString(PyExc_ValueError, "context_length must be positive.");
     return NULL;
   }
 
+  if (decoded_bit_length < 0) {
+    PyBuffer_Release(&encoded);
+    PyErr_SetString(PyExc_ValueError,
+                    "decoded_bit_length must not be negative.");
+    return NULL;
+  }
+
   // Allocate space for the decoded output based on bit length
-  size_t decoded_byte_length = (decoded_bit_length + 7) / 8;
+  size_t decoded_byte_length = ((size_t)decoded_bit_length + 7) / 8;
   uint8_t *decoded_output =
       (uint8_t *)calloc(decoded_byte_length, sizeof(uint8_t));
   if (!decoded_output) {
+    PyBuffer_Release(&encoded);
     PyErr_NoMemory();
     return NULL;
   }
 
-  // Call the C arithmetic_decode function with the decoded bit length
-  arithmetic_decode((const uint8_t *)encoded, (size_t)encoded_length,
-                    decoded_output, (size_t)decoded_bit_length,
-                    (size_t)context_length, get_probability_wrapper);
+  // Call the C arithmetic_decode function with the decoded bit length,
+  // releasing the GIL while the coder runs
+  int status;
+  Py_BEGIN_ALLOW_THREADS
+  status = arithmetic_decode((const uint8_t *)encoded.buf, (size_t)encoded.len,
+                             decoded_output, (size_t)decoded_bit_length,
+                             (size_t)context_length, get_probability_wrapper);
+  Py_END_ALLOW_THREADS
+  PyBuffer_Release(&encoded);
+
+  if (status != 0) {
+    free(decoded_output);
+    return PyErr_NoMemory();
+  }
 
   PyObject *result = PyBytes_FromStringAndSize((const char *)decoded_output,
                                                decoded_byte_length);
@@ -104,28 +142,260 @@ static PyObject *py_arithmetic_decode(PyObject *self, PyObject *args) {
   return result;
 }
 
+/**
+ * @brief Checks whether two packed bit sequences agree on their first bits.
+ *
+ * @param a First packed bit sequence.
+ * @param b Second packed bit sequence.
+ * @param bit_length Number of leading bits to compare.
+ * @return int 1 if the first bit_length bits match, 0 otherwise.
+ */
+static int bits_equal(const uint8_t *a, const uint8_t *b, size_t bit_length) {
+  size_t full_bytes = bit_length / 8;
+  if (memcmp(a, b, full_bytes) != 0) {
+    return 0;
+  }
+
+  size_t partial_bits = bit_length % 8;
+  if (partial_bits == 0) {
+    return 1;
+  }
+  uint8_t mask = (uint8_t)(0xFFU << (8 - partial_bits));
+  return ((a[full_bytes] ^ b[full_bytes]) & mask) == 0;
+}
+
+// Python wrapper encoding and decoding in one call, returning the encoded
+// bytes and whether the decoded bits match the input
+static PyObject *py_arithmetic_round_trip(PyObject *self, PyObject *args,
+                                          PyObject *kwargs) {
+  (void)self;  // Suppress unused parameter warning
+
+  static char *kwlist[] = {"sequence", "sequence_bit_length", "context_length",
+                           NULL};
+  Py_buffer sequence;
+  Py_ssize_t sequence_bit_length;
+  Py_ssize_t context_length;
+
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "y*nn", kwlist, &sequence,
+                                   &sequence_bit_length, &context_length)) {
+    return NULL;
+  }
+
+  if (context_length <= 0) {
+    PyBuffer_Release(&sequence);
+    PyErr_SetString(PyExc_ValueError, "context_length must be positive.");
+    return NULL;
+  }
+
+  if (sequence_bit_length < 0 ||
+      (size_t)sequence_bit_length > (size_t)sequence.len * 8) {
+    PyBuffer_Release(&sequence);
+    PyErr_SetString(PyExc_ValueError,
+                    "sequence_bit_length must be between 0 and 8 * "
+                    "len(sequence).");
+    return NULL;
+  }
+
+  // Encode, decode and compare entirely in C with the GIL released; the
+  // encoded stream is only turned into a Python object once at the end
+  size_t decoded_byte_length = ((size_t)sequence_bit_length + 7) / 8;
+  uint8_t *encoded_output = NULL;
+  size_t encoded_length;
+  uint8_t *decoded_output = NULL;
+  int decoded = 0;
+  int matches = 0;
+  Py_BEGIN_ALLOW_THREADS
+  encoded_length = arithmetic_encode(
+      (const uint8_t *)sequence.buf, (size_t)sequence_bit_length,
+      &encoded_output, (size_t)context_length, get_probability_wrapper);
+  if (encoded_output != NULL) {
+    if (decoded_byte_length == 0) {
+      // Nothing to decode, so an empty input always matches
+      decoded = 1;
+      matches = 1;
+    } else {
+      decoded_output = (uint8_t *)calloc(decoded_byte_length, sizeof(uint8_t));
+      if (decoded_output &&
+          arithmetic_decode(encoded_output, encoded_length, decoded_output,
+                            (size_t)sequence_bit_length, (size_t)context_length,
+                            get_probability_wrapper) == 0) {
+        decoded = 1;
+        matches = bits_equal((const uint8_t *)sequence.buf, decoded_output,
+                             (size_t)sequence_bit_length);
+      }
+    }
+  }
+  Py_END_ALLOW_THREADS
+  PyBuffer_Release(&sequence);
+  free(decoded_output);
+
+  if (!decoded) {
+    free(encoded_output);
+    return PyErr_NoMemory();
+  }
+
+  PyObject *result = Py_BuildValue("(y#O)", (const char *)encoded_output,
+                                   (Py_ssize_t)encoded_length,
+                                   matches ? Py_True : Py_False);
+  free(encoded_output);
+  return result;
+}
+
+// Python wrapper for arithmetic_encode_bytes
+static PyObject *py_arithmetic_encode_bytes(PyObject *self, PyObject *args,
+                                            PyObject *kwargs) {
+  (void)self;  // Suppress unused parameter warning
+
+  static char *kwlist[] = {"data", "context_length", NULL};
+  Py_buffer data;
+  Py_ssize_t context_length;
+
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "y*n", kwlist, &data,
+                                   &context_length)) {
+    return NULL;
+  }
+
+  if (context_length <= 0 ||
+      (size_t)context_length > (size_t)MAX_BYTE_CONTEXT_LENGTH) {
+    PyBuffer_Release(&data);
+    PyErr_Format(PyExc_ValueError,
+                 "context_length must be between 1 and %u.",
+                 (unsigned int)MAX_BYTE_CONTEXT_LENGTH);
+    return NULL;
+  }
+
+  // Code one byte per step with the GIL released
+  uint8_t *encoded_output = NULL;
+  size_t encoded_length;
+  Py_BEGIN_ALLOW_THREADS
+  encoded_length =
+      arithmetic_encode_bytes((const uint8_t *)data.buf, (size_t)data.len,
+                              &encoded_output, (size_t)context_length);
+  Py_END_ALLOW_THREADS
+  PyBuffer_Release(&data);
+
+  if (encoded_output == NULL) {
+    return PyErr_NoMemory();
+  }
+
+  PyObject *result =
+      PyBytes_FromStringAndSize((const char *)encoded_output, encoded_length);
+  free(encoded_output);
+  return result;
+}
+
+// Python wrapper for arithmetic_decode_bytes
+static PyObject *py_arithmetic_decode_bytes(PyObject *self, PyObject *args,
+                                            PyObject *kwargs) {
+  (void)self;  // Suppress unused parameter warning
+
+  static char *kwlist[] = {"encoded", "byte_length", "context_length", NULL};
+  Py_buffer encoded;
+  Py_ssize_t byte_length;
+  Py_ssize_t context_length;
+
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "y*nn", kwlist, &encoded,
+                                   &byte_length, &context_length)) {
+    return NULL;
+  }
+
+  if (context_length <= 0 ||
+      (size_t)context_length > (size_t)MAX_BYTE_CONTEXT_LENGTH) {
+    PyBuffer_Release(&encoded);
+    PyErr_Format(PyExc_ValueError,
+                 "context_length must be between 1 and %u.",
+                 (unsigned int)MAX_BYTE_CONTEXT_LENGTH);
+    return NULL;
+  }
+
+  if (byte_length < 0) {
+    PyBuffer_Release(&encoded);
+    PyErr_SetString(PyExc_ValueError, "byte_length must not be negative.");
+    return NULL;
+  }
+
+  // Decode straight into the bytes object that is returned
+  PyObject *result = PyBytes_FromStringAndSize(NULL, byte_length);
+  if (!result) {
+    PyBuffer_Release(&encoded);
+    return NULL;
+  }
+  uint8_t *decoded_output = (uint8_t *)PyBytes_AS_STRING(result);
+
+  int status;
+  Py_BEGIN_ALLOW_THREADS
+  status = arithmetic_decode_bytes((const uint8_t *)encoded.buf,
+                                   (size_t)encoded.len, decoded_output,
+                                   (size_t)byte_length, (size_t)context_length);
+  Py_END_ALLOW_THREADS
+  PyBuffer_Release(&encoded);
+
+  if (status != 0) {
+    Py_DECREF(result);
+    return PyErr_NoMemory();
+  }
+  return result;
+}
+
 // Module method definitions with updated docstrings
 PyMethodDef ArithmeticCodingMethods[] = {
-    {"encode", py_arithmetic_encode, METH_VARARGS,
-     "encode(sequence: bytes, sequence_bit_length: int, context_length: int) "
-     "-> bytes\n\n"
+    {"encode", (PyCFunction)(void (*)(void))py_arithmetic_encode,
+     METH_VARARGS | METH_KEYWORDS,
+     "encode(sequence: bytes-like, sequence_bit_length: int, "
+     "context_length: int) -> bytes\n\n"
      "Encodes a byte sequence using arithmetic coding.\n\n"
      "Parameters:\n"
-     "  sequence (bytes): The input byte sequence to encode.\n"
+     "  sequence (bytes-like): The input byte sequence to encode.\n"
      "  sequence_bit_length (int): The bit length of the input sequence.\n"
      "  context_length (int): The length of the context used for encoding.\n\n"
      "Returns:\n"
      "  bytes: The encoded byte sequence."},
-    {"decode", py_arithmetic_decode, METH_VARARGS,
-     "decode(encoded: bytes, decoded_bit_length: int, context_length: int) -> "
-     "bytes\n\n"
+    {"decode", (PyCFunction)(void (*)(void))py_arithmetic_decode,
+     METH_VARARGS | METH_KEYWORDS,
+     "decode(encoded: bytes-like, decoded_bit_length: int, "
+     "context_length: int) -> bytes\n\n"
      "Decodes an arithmetic-coded byte sequence.\n\n"
      "Parameters:\n"
-     "  encoded (bytes): The encoded byte sequence to decode.\n"
+     "  encoded (bytes-like): The encoded byte sequence to decode.\n"
      "  decoded_bit_length (int): The bit length of the decoded sequence.\n"
      "  context_length (int): The length of the context used for decoding.\n\n"
      "Returns:\n"
      "  bytes: The decoded byte sequence."},
+    {"round_trip", (PyCFunction)(void (*)(void))py_arithmetic_round_trip,
+     METH_VARARGS | METH_KEYWORDS,
+     "round_trip(sequence: bytes-like, sequence_bit_length: int, "
+     "context_length: int) -> Tuple[bytes, bool]\n\n"
+     "Encodes a byte sequence and decodes the result in a single call.\n\n"
+     "Parameters:\n"
+     "  sequence (bytes-like): The input byte sequence to encode.\n"
+     "  sequence_bit_length (int): The bit length of the input sequence.\n"
+     "  context_length (int): The length of the context used for coding.\n\n"
+     "Returns:\n"
+     "  Tuple[bytes, bool]: The encoded byte sequence, and whether decoding\n"
+     "  it reproduces the first sequence_bit_length bits of the input."},
+    {"encode_bytes", (PyCFunction)(void (*)(void))py_arithmetic_encode_bytes,
+     METH_VARARGS | METH_KEYWORDS,
+     "encode_bytes(data: bytes-like, context_length: int) -> bytes\n\n"
+     "Encodes a byte sequence one byte per step against an adaptive\n"
+     "256-symbol model.\n\n"
+     "Parameters:\n"
+     "  data (bytes-like): The input byte sequence to encode.\n"
+     "  context_length (int): The number of preceding bytes the model adapts\n"
+     "    to.\n\n"
+     "Returns:\n"
+     "  bytes: The encoded byte sequence."},
+    {"decode_bytes", (PyCFunction)(void (*)(void))py_arithmetic_decode_bytes,
+     METH_VARARGS | METH_KEYWORDS,
+     "decode_bytes(encoded: bytes-like, byte_length: int, "
+     "context_length: int) -> bytes\n\n"
+     "Decodes a byte sequence produced by encode_bytes.\n\n"
+     "Parameters:\n"
+     "  encoded (bytes-like): The encoded byte sequence to decode.\n"
+     "  byte_length (int): The number of bytes to decode.\n"
+     "  context_length (int): The number of preceding bytes the model adapts\n"
+     "    to.\n\n"
+     "Returns:\n"
+     "  bytes: The decoded byte sequence."},
     {NULL, NULL, 0, NULL}  // Sentinel
 };
 
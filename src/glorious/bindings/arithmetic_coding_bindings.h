@@ -28,14 +28,15 @@ uint32_t get_probability_wrapper(const ContextContent *context_content);
  * Encodes a byte sequence using arithmetic coding.
  *
  * Parameters:
- *   sequence (bytes): The input byte sequence to encode.
+ *   sequence (bytes-like): The input byte sequence to encode.
  *   sequence_bit_length (int): The bit length of the input sequence.
  *   context_length (int): The length of the context used for encoding.
  *
  * Returns:
  *   bytes: The encoded byte sequence.
  */
-static PyObject *py_arithmetic_encode(PyObject *self, PyObject *args);
+static PyObject *py_arithmetic_encode(PyObject *self, PyObject *args,
+                                      PyObject *kwargs);
 
 /**
  * @brief Python wrapper for arithmetic_decode.
@@ -43,14 +44,65 @@ static PyObject *py_arithmetic_encode(PyObject *self, PyObject *args);
  * Decodes an arithmetic-coded byte sequence.
  *
  * Parameters:
- *   encoded (bytes): The encoded byte sequence to decode.
+ *   encoded (bytes-like): The encoded byte sequence to decode.
  *   decoded_bit_length (int): The bit length of the decoded sequence.
  *   context_length (int): The length of the context used for decoding.
  *
  * Returns:
  *   bytes: The decoded byte sequence.
  */
-static PyObject *py_arithmetic_decode(PyObject *self, PyObject *args);
+static PyObject *py_arithmetic_decode(PyObject *self, PyObject *args,
+                                      PyObject *kwargs);
+
+/**
+ * @brief Python wrapper encoding and decoding in a single call.
+ *
+ * Encodes a byte sequence, decodes the result and compares it with the input
+ * without creating intermediate Python objects.
+ *
+ * Parameters:
+ *   sequence (bytes-like): The input byte sequence to encode.
+ *   sequence_bit_length (int): The bit length of the input sequence.
+ *   context_length (int): The length of the context used for coding.
+ *
+ * Returns:
+ *   Tuple[bytes, bool]: The encoded byte sequence, and whether decoding it
+ *   reproduces the input.
+ */
+static PyObject *py_arithmetic_round_trip(PyObject *self, PyObject *args,
+                                          PyObject *kwargs);
+
+/**
+ * @brief Python wrapper for arithmetic_encode_bytes.
+ *
+ * Encodes a byte sequence one byte per step against an adaptive 256-symbol
+ * model.
+ *
+ * Parameters:
+ *   data (bytes-like): The input byte sequence to encode.
+ *   context_length (int): The number of preceding bytes the model adapts to.
+ *
+ * Returns:
+ *   bytes: The encoded byte sequence.
+ */
+static PyObject *py_arithmetic_encode_bytes(PyObject *self, PyObject *args,
+                                            PyObject *kwargs);
+
+/**
+ * @brief Python wrapper for arithmetic_decode_bytes.
+ *
+ * Decodes a byte sequence produced by encode_bytes.
+ *
+ * Parameters:
+ *   encoded (bytes-like): The encoded byte sequence to decode.
+ *   byte_length (int): The number of bytes to decode.
+ *   context_length (int): The number of preceding bytes the model adapts to.
+ *
+ * Returns:
+ *   bytes: The decoded byte sequence.
+ */
+static PyObject *py_arithmetic_decode_bytes(PyObject *self, PyObject *args,
+                                            PyObject *kwargs);
 
 /**
  * @brief Module method definitions.
@@ -1,9 +1,13 @@
-def encode(sequence: bytes, sequence_bit_length: int, context_length: int) -> bytes:
+from typing import Tuple, Union
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+def encode(sequence: BytesLike, sequence_bit_length: int, context_length: int) -> bytes:
     """
     Encode a byte sequence using arithmetic coding.
 
     Parameters:
-        sequence (bytes): The input byte sequence to encode.
+        sequence (bytes-like): The input byte sequence to encode.
         sequence_bit_length (int): The bit length of the input sequence.
         context_length (int): The length of the context used for encoding.
 
@@ -12,12 +16,12 @@ def encode(sequence: bytes, sequence_bit_length: int, context_length: int) -> by
     """
     pass
 
-def decode(encoded: bytes, decoded_bit_length: int, context_length: int) -> bytes:
+def decode(encoded: BytesLike, decoded_bit_length: int, context_length: int) -> bytes:
     """
     Decode an arithmetic-coded byte sequence.
 
     Parameters:
-        encoded (bytes): The encoded byte sequence to decode.
+        encoded (bytes-like): The encoded byte sequence to decode.
         decoded_bit_length (int): The bit length of the decoded sequence.
         context_length (int): The length of the context used for decoding.
 
@@ -25,3 +29,47 @@ def decode(encoded: bytes, decoded_bit_length: int, context_length: int) -> byte
         bytes: The decoded byte sequence.
     """
     pass
+
+def round_trip(
+    sequence: BytesLike, sequence_bit_length: int, context_length: int
+) -> Tuple[bytes, bool]:
+    """
+    Encode a byte sequence and decode the result in a single call.
+
+    Parameters:
+        sequence (bytes-like): The input byte sequence to encode.
+        sequence_bit_length (int): The bit length of the input sequence.
+        context_length (int): The length of the context used for coding.
+
+    Returns:
+        Tuple[bytes, bool]: The encoded byte sequence, and whether decoding it
+        reproduces the first sequence_bit_length bits of the input.
+    """
+    pass
+
+def encode_bytes(data: BytesLike, context_length: int) -> bytes:
+    """
+    Encode a byte sequence one byte per step against an adaptive 256-symbol model.
+
+    Parameters:
+        data (bytes-like): The input byte sequence to encode.
+        context_length (int): The number of preceding bytes the model adapts to.
+
+    Returns:
+        bytes: The encoded byte sequence.
+    """
+    pass
+
+def decode_bytes(encoded: BytesLike, byte_length: int, context_length: int) -> bytes:
+    """
+    Decode a byte sequence produced by encode_bytes.
+
+    Parameters:
+        encoded (bytes-like): The encoded byte sequence to decode.
+        byte_length (int): The number of bytes to decode.
+        context_length (int): The number of preceding bytes the model adapts to.
+
+    Returns:
+        bytes: The decoded byte sequence.
+    """
+    pass
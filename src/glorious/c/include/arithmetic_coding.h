@@ -15,10 +15,14 @@
 #endif
 
 #define FIXED_SCALE (1 << 16)  // Fixed-point scaling factor (16 bits)
-#define MAX_CONTEXT_BYTES \
-  (256 * 1000)  // Maximum context size in bytes (adjust as needed)
+#define MAX_CONTEXT_REGISTER_BITS \
+  64  // Contexts up to this many bits are kept in a single integer register
 #define INITIAL_OUTPUT_CAPACITY \
   4096  // Initial buffer size to minimize reallocations
+#define BYTE_ALPHABET_SIZE 256  // Number of symbols in the byte-level model
+#define MAX_BYTE_CONTEXT_LENGTH                                    \
+  ((1U << (PRECISION - 2)) - BYTE_ALPHABET_SIZE)  // Keeps every byte's
+                                                  // interval non-empty
 
 /**
  * @brief Structure representing the state of the arithmetic coder.
@@ -34,12 +38,16 @@ typedef struct {
   uint8_t bit_buffer;      // Buffer for bits being written
   uint8_t bit_count;       // Number of bits currently in the bit_buffer
 
-  // Ring buffer context management
-  uint8_t context_buffer[MAX_CONTEXT_BYTES];  // Buffer to store context bits as
-                                              // a ring buffer
+  // Ring buffer context management (context_capacity > 64)
+  uint8_t *context_buffer;  // Buffer to store context bits as a ring buffer,
+                            // sized to the bits actually coded
   size_t context_capacity;  // Size of the context buffer in bits
   size_t context_index;     // Current index in the ring buffer
 
+  // Shift register context management (context_capacity <= 64)
+  uint64_t context_register;  // Most recent context bits, newest in the LSB
+  uint64_t context_mask;      // Mask keeping the lowest context_capacity bits
+
   size_t count_ones;  // Number of '1's in the current context
 } ArithmeticCoder;
 
@@ -47,12 +55,32 @@ typedef struct {
  * @brief Function pointer type for obtaining fixed-point probabilities based on
  * context.
  *
+ * The function must be pure: the coder evaluates it once per possible count of
+ * '1's and looks the results up from a table while coding.
+ *
  * @param context_content Pointer to the ContextContent struct.
  * @return uint32_t Fixed-point probability of the current bit being '1', scaled
  * by FIXED_SCALE.
  */
 typedef uint32_t (*ProbabilityFunction)(const ContextContent *context_content);
 
+/**
+ * @brief Adaptive byte frequency model over a sliding window of recent bytes.
+ *
+ * Every byte value has a frequency of one plus its number of occurrences in
+ * the window. The frequencies are kept in a Fenwick tree so that cumulative
+ * frequencies can be queried, updated and searched in log2(256) steps.
+ */
+typedef struct {
+  uint32_t tree[BYTE_ALPHABET_SIZE + 1];  // Fenwick tree of byte frequencies
+                                          // (1-indexed)
+  uint32_t total;    // Sum of all byte frequencies
+  uint8_t *window;   // Ring buffer of the most recent bytes
+  size_t capacity;   // Size of the window in bytes
+  size_t index;      // Next write position in the window
+  size_t fill;       // Number of bytes currently in the window
+} ByteModel;
+
 /**
  * @brief Performs arithmetic encoding on a sequence of bits using fixed-point
  * probabilities.
@@ -64,7 +92,8 @@ typedef uint32_t (*ProbabilityFunction)(const ContextContent *context_content);
  * @param context_length Length of the context in bits.
  * @param get_probability_fixed Function pointer to obtain the probability of
  * bit '1' given the context.
- * @return size_t The size of the encoded output in bytes.
+ * @return size_t The size of the encoded output in bytes, or 0 with
+ * *encoded_output set to NULL if memory could not be allocated.
  */
 size_t arithmetic_encode(const uint8_t *sequence, size_t length,
                          uint8_t **encoded_output, size_t context_length,
@@ -83,10 +112,43 @@ size_t arithmetic_encode(const uint8_t *sequence, size_t length,
  * @param context_length Length of the context in bits.
  * @param get_probability_fixed Function pointer to obtain the probability of
  * bit '1' given the context.
+ * @return int 0 on success, -1 if memory could not be allocated.
+ */
+int arithmetic_decode(const uint8_t *encoded, size_t encoded_length,
+                      uint8_t *decoded, size_t decoded_length,
+                      size_t context_length,
+                      ProbabilityFunction get_probability_fixed);
+
+/**
+ * @brief Performs arithmetic encoding on a sequence of bytes, coding one byte
+ * per step against an adaptive 256-symbol frequency model.
+ *
+ * @param data Pointer to the input bytes.
+ * @param length Number of bytes in the input.
+ * @param encoded_output Pointer to the output buffer where encoded data will be
+ * stored. The caller is responsible for freeing this buffer.
+ * @param context_length Number of preceding bytes the model adapts to. Must be
+ * between 1 and MAX_BYTE_CONTEXT_LENGTH.
+ * @return size_t The size of the encoded output in bytes, or 0 with
+ * *encoded_output set to NULL if memory could not be allocated.
+ */
+size_t arithmetic_encode_bytes(const uint8_t *data, size_t length,
+                               uint8_t **encoded_output, size_t context_length);
+
+/**
+ * @brief Decodes a byte sequence produced by arithmetic_encode_bytes.
+ *
+ * @param encoded Pointer to the encoded byte array.
+ * @param encoded_length Length of the encoded data in bytes.
+ * @param decoded Pointer to the buffer where decoded bytes will be stored. The
+ * buffer should be pre-allocated by the caller and hold decoded_length bytes.
+ * @param decoded_length Number of bytes to decode.
+ * @param context_length Number of preceding bytes the model adapts to. Must
+ * match the value used for encoding.
+ * @return int 0 on success, -1 if memory could not be allocated.
  */
-void arithmetic_decode(const uint8_t *encoded, size_t encoded_length,
-                       uint8_t *decoded, size_t decoded_length,
-                       size_t context_length,
-                       ProbabilityFunction get_probability_fixed);
+int arithmetic_decode_bytes(const uint8_t *encoded, size_t encoded_length,
+                            uint8_t *decoded, size_t decoded_length,
+                            size_t context_length);
 
 #endif  // ARITHMETIC_CODING_H
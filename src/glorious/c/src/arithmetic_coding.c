@@ -189,7 +189,9 @@ static inline uint32_t clamp_probability_fixed(uint32_t p1_fixed) {
  *
  * During encoding, when the range is rescaled, certain bits may need to be
  * outputted after a rescaling event. This function handles that by outputting
- * the specified bit multiple times.
+ * the specified bit multiple times. The run is written as whole bytes: the
+ * partial byte in the bit_buffer is topped up, every complete byte of the run
+ * is filled in a single memset, and the remainder starts the next byte.
  *
  * @param coder Pointer to the ArithmeticCoder instance. (Non-aliasing)
  * @param bit The bit to output (0 or 1).
@@ -198,26 +200,82 @@ static inline void output_following_bits(ArithmeticCoder *restrict coder,
                                          int bit) {
   size_t count = coder->bits_to_follow;
   if (count == 0) return;
+  coder->bits_to_follow = 0;
 
-  // Optimize by handling multiple bits at once if possible
-  while (count > 0) {
-    size_t bits_to_write =
-        count < 8 - coder->bit_count ? count : 8 - coder->bit_count;
-    for (size_t i = 0; i < bits_to_write; i++) {
-      coder->bit_buffer = (coder->bit_buffer << 1) | (bit & 1);
-      coder->bit_count++;
-    }
-    count -= bits_to_write;
+  const unsigned int fill = (bit & 1) ? 0xFFU : 0x00U;
+  const size_t room = 8U - coder->bit_count;
+
+  // The run fits in the current byte
+  if (count < room) {
+    coder->bit_buffer = (uint8_t)((coder->bit_buffer << count) |
+                                  (fill & ((1U << count) - 1)));
+    coder->bit_count = (uint8_t)(coder->bit_count + count);
+    return;
+  }
 
-    if (coder->bit_count == 8) {
-      ensure_output_capacity(coder, 1);
-      coder->output[coder->output_size++] = (uint8_t)coder->bit_buffer;
-      coder->bit_buffer = 0;
-      coder->bit_count = 0;
+  // Complete the current byte
+  ensure_output_capacity(coder, 1 + (count - room) / 8);
+  coder->output[coder->output_size++] =
+      (uint8_t)((coder->bit_buffer << room) | (fill & ((1U << room) - 1)));
+  count -= room;
+
+  // Fill the whole bytes of the run at once
+  size_t whole_bytes = count / 8;
+  memset(coder->output + coder->output_size, (int)fill, whole_bytes);
+  coder->output_size += whole_bytes;
+
+  // Start the next byte with the remaining bits
+  count %= 8;
+  coder->bit_buffer = (uint8_t)(fill & ((1U << count) - 1));
+  coder->bit_count = (uint8_t)count;
+}
+
+/**
+ * @brief Initializes an all-zero context of the given length.
+ *
+ * The ring never wraps before length bits are coded, so the context is sized
+ * to the smaller of context_length and length; the coder behaves identically.
+ * Contexts of at most MAX_CONTEXT_REGISTER_BITS bits are tracked in a single
+ * integer instead of the byte ring buffer, so each update is a shift and a
+ * mask rather than a read-modify-write of the buffer. Longer contexts get a
+ * zeroed ring buffer, which must be released with free_context.
+ *
+ * @param coder Pointer to the ArithmeticCoder instance. (Non-aliasing)
+ * @param context_length Length of the context in bits.
+ * @param length Number of bits that will be coded.
+ * @return int 0 on success, -1 if the ring buffer could not be allocated.
+ */
+static inline int init_context(ArithmeticCoder *restrict coder,
+                               size_t context_length, size_t length) {
+  size_t capacity = context_length < length ? context_length : length;
+  coder->context_capacity = capacity;
+  coder->context_index = 0;
+  coder->count_ones = 0;
+  coder->context_register = 0;
+  coder->context_buffer = NULL;
+
+  if (capacity <= MAX_CONTEXT_REGISTER_BITS) {
+    coder->context_mask = (capacity == MAX_CONTEXT_REGISTER_BITS)
+                              ? UINT64_MAX
+                              : (UINT64_C(1) << capacity) - 1;
+  } else {
+    coder->context_mask = 0;
+    coder->context_buffer = calloc((capacity + 7) / 8, sizeof(uint8_t));
+    if (UNLIKELY(!coder->context_buffer)) {
+      return -1;
     }
   }
+  return 0;
+}
 
-  coder->bits_to_follow = 0;
+/**
+ * @brief Releases the context ring buffer, if one was allocated.
+ *
+ * @param coder Pointer to the ArithmeticCoder instance. (Non-aliasing)
+ */
+static inline void free_context(ArithmeticCoder *restrict coder) {
+  free(coder->context_buffer);
+  coder->context_buffer = NULL;
 }
 
 /**
@@ -226,14 +284,24 @@ static inline void output_following_bits(ArithmeticCoder *restrict coder,
  *
  * Inserts a new bit into the context buffer at the current index, updates the
  * count of '1's based on the new and old bit, and updates the index in a
- * circular manner.
+ * circular manner. Short contexts use the shift register instead.
  *
  * @param coder Pointer to the ArithmeticCoder instance. (Non-aliasing)
  * @param new_bit The new bit to add (0 or 1).
  */
 static inline void update_context_ring_buffer(ArithmeticCoder *restrict coder,
                                               int new_bit) {
-  if (LIKELY(coder->context_capacity > 0)) {
+  if (LIKELY(coder->context_capacity <= MAX_CONTEXT_REGISTER_BITS)) {
+    if (LIKELY(coder->context_capacity > 0)) {
+      // The oldest bit sits just above the newest context_capacity - 1 bits
+      int old_bit =
+          (int)((coder->context_register >> (coder->context_capacity - 1)) & 1);
+      coder->context_register =
+          ((coder->context_register << 1) | (uint64_t)(new_bit & 1)) &
+          coder->context_mask;
+      coder->count_ones = coder->count_ones + (size_t)new_bit - (size_t)old_bit;
+    }
+  } else {
     size_t byte_pos = coder->context_index >> 3;      // Equivalent to /8
     size_t bit_pos = 7 - (coder->context_index & 7);  // Equivalent to %8
 
@@ -246,7 +314,7 @@ static inline void update_context_ring_buffer(ArithmeticCoder *restrict coder,
         (coder->context_buffer[byte_pos] & ~mask) | ((new_bit & 1) << bit_pos);
 
     // Update the count of '1's
-    coder->count_ones += (uint32_t)new_bit - (uint32_t)old_bit;
+    coder->count_ones = coder->count_ones + (size_t)new_bit - (size_t)old_bit;
 
     // Update the context index in a circular manner
     coder->context_index++;
@@ -256,6 +324,63 @@ static inline void update_context_ring_buffer(ArithmeticCoder *restrict coder,
   }
 }
 
+/**
+ * @brief Scales a fixed-point probability of '1' to the coder's range.
+ *
+ * The probability is clamped to [1, FIXED_SCALE - 1] first, so neither bit
+ * value ever gets an empty interval, whatever the probability function returns.
+ *
+ * @param p1_fixed Probability of bit '1', scaled by FIXED_SCALE.
+ * @return uint32_t Probability of bit '0' scaled to 1 << PRECISION, clamped
+ * below the total frequency.
+ */
+static inline uint32_t scale_probability_zero(uint32_t p1_fixed) {
+  const uint32_t TOTAL_FREQUENCY = 1U << PRECISION;
+  uint32_t p0_fixed = FIXED_SCALE - clamp_probability_fixed(p1_fixed);
+
+  // Scale probabilities to the total frequency range
+  uint32_t scaled_p0 =
+      (uint32_t)(((uint64_t)p0_fixed * TOTAL_FREQUENCY) / FIXED_SCALE);
+  return (scaled_p0 >= TOTAL_FREQUENCY) ? (TOTAL_FREQUENCY - 1) : scaled_p0;
+}
+
+/**
+ * @brief Tabulates the scaled probability over every reachable context.
+ *
+ * ContextContent only varies in count_ones during a coding pass, and
+ * count_ones can never exceed the context length or the number of bits coded.
+ * Evaluating the probability function and scaling its result once per
+ * possible count turns the per-bit indirect call and rescaling into a single
+ * table lookup.
+ *
+ * @param context_length Length of the context in bits.
+ * @param length Number of bits that will be coded.
+ * @param get_probability_fixed Function pointer to obtain the probability of
+ * bit '1' given the context.
+ * @return uint32_t* Table of probabilities of bit '0' scaled to the total
+ * frequency, indexed by count_ones, or NULL if it could not be allocated. The
+ * caller must free it.
+ */
+static uint32_t *build_probability_table(
+    size_t context_length, size_t length,
+    ProbabilityFunction get_probability_fixed) {
+  size_t max_count = context_length < length ? context_length : length;
+  uint32_t *table = malloc((max_count + 1) * sizeof(uint32_t));
+  if (UNLIKELY(!table)) {
+    return NULL;
+  }
+
+  ContextContent context_content = {0};
+  context_content.context_length = context_length;
+  for (size_t count = 0; count <= max_count; count++) {
+    context_content.count_ones = (int)count;
+    table[count] =
+        scale_probability_zero(get_probability_fixed(&context_content));
+  }
+
+  return table;
+}
+
 // -----------------------------
 // Arithmetic Encoding Function
 // -----------------------------
@@ -272,7 +397,8 @@ static inline void update_context_ring_buffer(ArithmeticCoder *restrict coder,
  * @param get_probability_fixed Function pointer to obtain the probability of
  * bit '1' given the context. It should return a fixed-point probability scaled
  * by FIXED_SCALE.
- * @return size_t The size of the encoded output in bytes.
+ * @return size_t The size of the encoded output in bytes, or 0 with
+ * *encoded_output set to NULL if memory could not be allocated.
  */
 size_t arithmetic_encode(const uint8_t *restrict sequence, size_t length,
                          uint8_t **encoded_output, size_t context_length,
@@ -288,25 +414,36 @@ size_t arithmetic_encode(const uint8_t *restrict sequence, size_t length,
   ArithmeticCoder coder = {0};
   coder.high = TOTAL_FREQUENCY - 1;
   coder.low = 0;  // Initialize low as 0
-  coder.output = malloc(INITIAL_OUTPUT_CAPACITY);
+  // Size the output for the common case of output no larger than the input
+  // (plus a few bytes of termination) so that typical inputs never realloc
+  size_t initial_capacity = (length >> 3) + 8;
+  if (initial_capacity < INITIAL_OUTPUT_CAPACITY) {
+    initial_capacity = INITIAL_OUTPUT_CAPACITY;
+  }
+  *encoded_output = NULL;
+  coder.output = malloc(initial_capacity);
   if (UNLIKELY(!coder.output)) {
-    perror("Initial malloc failed");
-    exit(EXIT_FAILURE);
+    return 0;
   }
   coder.output_size = 0;
-  coder.output_capacity = INITIAL_OUTPUT_CAPACITY;
+  coder.output_capacity = initial_capacity;
   coder.bits_to_follow = 0;
   coder.bit_buffer = 0;
   coder.bit_count = 0;
-  memset(coder.context_buffer, 0,
-         MAX_CONTEXT_BYTES);  // Initialize context to zero
-  coder.context_capacity = context_length;
-  coder.context_index = 0;
-  coder.count_ones = 0;  // Initialize count of '1's to zero
+  // Initialize context to zero
+  if (UNLIKELY(init_context(&coder, context_length, length) != 0)) {
+    free(coder.output);
+    return 0;
+  }
 
-  // Initialize ContextContent
-  ContextContent context_content = {0};
-  context_content.context_length = context_length;
+  // Precompute the probability for every reachable count of '1's
+  uint32_t *probability_table =
+      build_probability_table(context_length, length, get_probability_fixed);
+  if (UNLIKELY(!probability_table)) {
+    free_context(&coder);
+    free(coder.output);
+    return 0;
+  }
 
   // Iterate over each bit in the input sequence
   for (size_t i = 0; i < length; i++) {
@@ -314,18 +451,9 @@ size_t arithmetic_encode(const uint8_t *restrict sequence, size_t length,
     uint8_t byte = sequence[i >> 3];
     uint8_t bit = (byte >> (7 - (i & 7))) & 1;
 
-    // Populate ContextContent with the current count of '1's
-    context_content.count_ones = coder.count_ones;
-
-    // Obtain the probability of the current bit being '1' based on the context
-    uint32_t p1_fixed = get_probability_fixed(&context_content);
-    uint32_t p0_fixed = FIXED_SCALE - p1_fixed;
-
-    // Scale probabilities to the total frequency range
-    uint32_t scaled_p0 =
-        (uint32_t)(((uint64_t)p0_fixed * TOTAL_FREQUENCY) / FIXED_SCALE);
-    scaled_p0 =
-        (scaled_p0 >= TOTAL_FREQUENCY) ? (TOTAL_FREQUENCY - 1) : scaled_p0;
+    // Look up the scaled probability of the current bit being '0' based on
+    // the current count of '1's in the context
+    uint32_t scaled_p0 = probability_table[coder.count_ones];
 
     // Calculate the current range
     uint32_t range = coder.high - coder.low + 1;
@@ -385,6 +513,9 @@ size_t arithmetic_encode(const uint8_t *restrict sequence, size_t length,
   // Flush any remaining bits in the buffer to the output
   flush_output(&coder);
 
+  free(probability_table);
+  free_context(&coder);
+
   // Set the encoded_output pointer to the coder's output buffer
   *encoded_output = coder.output;
 
@@ -409,11 +540,12 @@ size_t arithmetic_encode(const uint8_t *restrict sequence, size_t length,
  * @param get_probability_fixed Function pointer to obtain the probability of
  * bit '1' given the context. It should return a fixed-point probability scaled
  * by FIXED_SCALE.
+ * @return int 0 on success, -1 if memory could not be allocated.
  */
-void arithmetic_decode(const uint8_t *restrict encoded, size_t encoded_length,
-                       uint8_t *restrict decoded, size_t decoded_length,
-                       size_t context_length,
-                       ProbabilityFunction get_probability_fixed) {
+int arithmetic_decode(const uint8_t *restrict encoded, size_t encoded_length,
+                      uint8_t *restrict decoded, size_t decoded_length,
+                      size_t context_length,
+                      ProbabilityFunction get_probability_fixed) {
   // Precompute constants based on PRECISION
   const uint32_t TOTAL_FREQUENCY =
       1U << PRECISION;  // Total frequency range (e.g., 2^31)
@@ -430,15 +562,18 @@ void arithmetic_decode(const uint8_t *restrict encoded, size_t encoded_length,
   coder.bits_to_follow = 0;
   coder.bit_buffer = 0;
   coder.bit_count = 0;
-  memset(coder.context_buffer, 0,
-         MAX_CONTEXT_BYTES);  // Initialize context to zero
-  coder.context_capacity = context_length;
-  coder.context_index = 0;
-  coder.count_ones = 0;  // Initialize count of '1's to zero
+  // Initialize context to zero
+  if (UNLIKELY(init_context(&coder, context_length, decoded_length) != 0)) {
+    return -1;
+  }
 
-  // Initialize ContextContent
-  ContextContent context_content = {0};
-  context_content.context_length = context_length;
+  // Precompute the probability for every reachable count of '1's
+  uint32_t *probability_table = build_probability_table(
+      context_length, decoded_length, get_probability_fixed);
+  if (UNLIKELY(!probability_table)) {
+    free_context(&coder);
+    return -1;
+  }
 
   size_t bit_index = 0;  // Initialize bit index for reading encoded data
 
@@ -449,20 +584,13 @@ void arithmetic_decode(const uint8_t *restrict encoded, size_t encoded_length,
         (coder.value << 1) | read_bit(encoded, &bit_index, encoded_length);
   }
 
+  uint8_t decoded_byte = 0;  // Decoded bits not yet stored to the output
+
   // Iterate over each bit to decode
   for (size_t i = 0; i < decoded_length; i++) {
-    // Populate ContextContent with the current count of '1's
-    context_content.count_ones = coder.count_ones;
-
-    // Obtain the probability of the current bit being '1' based on the context
-    uint32_t p1_fixed = get_probability_fixed(&context_content);
-    uint32_t p0_fixed = FIXED_SCALE - p1_fixed;
-
-    // Scale probabilities to the total frequency range
-    uint32_t scaled_p0 =
-        (uint32_t)(((uint64_t)p0_fixed * TOTAL_FREQUENCY) / FIXED_SCALE);
-    scaled_p0 =
-        (scaled_p0 >= TOTAL_FREQUENCY) ? (TOTAL_FREQUENCY - 1) : scaled_p0;
+    // Look up the scaled probability of the current bit being '0' based on
+    // the current count of '1's in the context
+    uint32_t scaled_p0 = probability_table[coder.count_ones];
 
     // Calculate the current range
     uint32_t range = coder.high - coder.low + 1;
@@ -475,13 +603,11 @@ void arithmetic_decode(const uint8_t *restrict encoded, size_t encoded_length,
 
     uint8_t bit = (scaled_value < scaled_p0) ? 0 : 1;
 
-    // Set the decoded bit in the output buffer using precomputed masks
-    if (bit) {
-      decoded[i >> 3] |=
-          (1U << (7 - (i & 7)));  // Set the corresponding bit to '1'
-    } else {
-      decoded[i >> 3] &=
-          ~(1U << (7 - (i & 7)));  // Ensure the corresponding bit is '0'
+    // Collect decoded bits and store them a whole byte at a time
+    decoded_byte = (uint8_t)((decoded_byte << 1) | bit);
+    if ((i & 7) == 7) {
+      decoded[i >> 3] = decoded_byte;
+      decoded_byte = 0;
     }
 
     // Update the context with the decoded bit using the ring buffer
@@ -496,25 +622,24 @@ void arithmetic_decode(const uint8_t *restrict encoded, size_t encoded_length,
     }
 
     // Renormalization: Shift the range until the high and low share the same
-    // top bits
+    // top bits, removing the same offset from value, low and high
     while (1) {
+      uint32_t offset;
       if (coder.high < HALF) {
         // The range is entirely in the lower half
-        // No adjustment needed for value
+        offset = 0;
       } else if (coder.low >= HALF) {
         // The range is entirely in the upper half
-        coder.value -= HALF;  // Remove the lower half from value
-        coder.low -= HALF;    // Remove the lower half from low\
-
-        coder.high -= HALF;   // Remove the lower half from high
+        offset = HALF;
       } else if (coder.low >= QUARTER && coder.high < THREE_QUARTER) {
         // The range is in the middle half
-        coder.value -= QUARTER;  // Remove the lower quarter from value
-        coder.low -= QUARTER;    // Remove the lower quarter from low
-        coder.high -= QUARTER;   // Remove the lower quarter from high
+        offset = QUARTER;
       } else {
         break;  // No renormalization needed
       }
+      coder.value -= offset;
+      coder.low -= offset;
+      coder.high -= offset;
 
       // Shift the range left by one bit
       coder.low <<= 1;
@@ -526,5 +651,315 @@ void arithmetic_decode(const uint8_t *restrict encoded, size_t encoded_length,
     }
   }
 
+  // Store the bits of a final partial byte, leaving its unused low bits as
+  // they were in the caller's buffer
+  size_t partial_bits = decoded_length & 7;
+  if (partial_bits > 0) {
+    uint8_t keep_mask = (uint8_t)(0xFFU >> partial_bits);
+    uint8_t *last = &decoded[decoded_length >> 3];
+    *last = (uint8_t)((*last & keep_mask) |
+                      (decoded_byte << (8 - partial_bits)));
+  }
+
   // No memory to free for coder.output as it's not used in decoding
+  free(probability_table);
+  free_context(&coder);
+  return 0;
+}
+
+// -----------------------------
+// Byte-Level Model Helpers
+// -----------------------------
+
+/**
+ * @brief Initializes the byte model with a frequency of one for every byte.
+ *
+ * The window never holds more bytes than are coded, so it is sized to the
+ * smaller of context_length and length; the model behaves identically.
+ *
+ * @param model Pointer to the ByteModel. (Non-aliasing)
+ * @param context_length Size of the sliding window in bytes.
+ * @param length Number of bytes that will be coded.
+ * @return int 0 on success, -1 if the window could not be allocated.
+ */
+static int init_byte_model(ByteModel *restrict model, size_t context_length,
+                           size_t length) {
+  // With every frequency equal to one, each tree node covers exactly as many
+  // symbols as its lowest set bit
+  for (uint32_t i = 1; i <= BYTE_ALPHABET_SIZE; i++) {
+    model->tree[i] = i & (~i + 1);
+  }
+  model->tree[0] = 0;
+  model->total = BYTE_ALPHABET_SIZE;
+  model->capacity = context_length < length ? context_length : length;
+  if (model->capacity == 0) {
+    model->capacity = 1;
+  }
+  model->index = 0;
+  model->fill = 0;
+  model->window = malloc(model->capacity);
+  return model->window ? 0 : -1;
+}
+
+/**
+ * @brief Releases the byte model's window.
+ *
+ * @param model Pointer to the ByteModel. (Non-aliasing)
+ */
+static inline void free_byte_model(ByteModel *restrict model) {
+  free(model->window);
+  model->window = NULL;
+}
+
+/**
+ * @brief Adds delta to the frequency of a byte value.
+ *
+ * @param model Pointer to the ByteModel. (Non-aliasing)
+ * @param symbol The byte value.
+ * @param delta Amount to add (may wrap to subtract).
+ */
+static inline void byte_model_add(ByteModel *restrict model, uint32_t symbol,
+                                  uint32_t delta) {
+  for (uint32_t i = symbol + 1; i <= BYTE_ALPHABET_SIZE; i += i & (~i + 1)) {
+    model->tree[i] += delta;
+  }
+}
+
+/**
+ * @brief Returns the total frequency of all byte values below symbol.
+ *
+ * @param model Pointer to the ByteModel. (Non-aliasing)
+ * @param symbol The byte value (0 to BYTE_ALPHABET_SIZE).
+ * @return uint32_t The cumulative frequency.
+ */
+static inline uint32_t byte_model_cumulative(const ByteModel *restrict model,
+                                             uint32_t symbol) {
+  uint32_t sum = 0;
+  for (uint32_t i = symbol; i > 0; i &= i - 1) {
+    sum += model->tree[i];
+  }
+  return sum;
+}
+
+/**
+ * @brief Finds the byte value whose cumulative interval contains target.
+ *
+ * @param model Pointer to the ByteModel. (Non-aliasing)
+ * @param target A cumulative frequency below model->total.
+ * @param cumulative_low Set to the cumulative frequency of the found byte.
+ * @return uint32_t The byte value.
+ */
+static inline uint32_t byte_model_find(const ByteModel *restrict model,
+                                       uint32_t target,
+                                       uint32_t *cumulative_low) {
+  uint32_t position = 0;
+  uint32_t sum = 0;
+  for (uint32_t step = BYTE_ALPHABET_SIZE; step > 0; step >>= 1) {
+    uint32_t next = position + step;
+    if (next <= BYTE_ALPHABET_SIZE && sum + model->tree[next] <= target) {
+      position = next;
+      sum += model->tree[next];
+    }
+  }
+  *cumulative_low = sum;
+  return position;
+}
+
+/**
+ * @brief Pushes a coded byte into the window, retiring the oldest one once the
+ * window is full.
+ *
+ * @param model Pointer to the ByteModel. (Non-aliasing)
+ * @param byte The byte that was just coded.
+ */
+static inline void update_byte_model(ByteModel *restrict model, uint8_t byte) {
+  if (model->fill == model->capacity) {
+    byte_model_add(model, model->window[model->index], (uint32_t)-1);
+  } else {
+    model->fill++;
+    model->total++;
+  }
+  byte_model_add(model, byte, 1);
+  model->window[model->index] = byte;
+  if (++model->index == model->capacity) {
+    model->index = 0;
+  }
+}
+
+// -----------------------------
+// Byte-Level Arithmetic Encoding Function
+// -----------------------------
+
+/**
+ * @brief Encodes a sequence of bytes using arithmetic coding, one byte per
+ * step.
+ *
+ * @param data Pointer to the input bytes. (Non-aliasing)
+ * @param length Number of bytes in the input.
+ * @param encoded_output Pointer to the output buffer where encoded data will be
+ * stored. The caller is responsible for freeing this buffer. (Non-aliasing)
+ * @param context_length Number of preceding bytes the model adapts to.
+ * @return size_t The size of the encoded output in bytes, or 0 with
+ * *encoded_output set to NULL if memory could not be allocated.
+ */
+size_t arithmetic_encode_bytes(const uint8_t *restrict data, size_t length,
+                               uint8_t **restrict encoded_output,
+                               size_t context_length) {
+  // Precompute constants based on PRECISION
+  const uint32_t TOTAL_FREQUENCY = 1U << PRECISION;
+  const uint32_t HALF = 1U << (PRECISION - 1);
+  const uint32_t QUARTER = 1U << (PRECISION - 2);
+  const uint32_t THREE_QUARTER = 3U << (PRECISION - 2);
+
+  ArithmeticCoder coder = {0};
+  coder.high = TOTAL_FREQUENCY - 1;
+  size_t initial_capacity = length + 8;
+  if (initial_capacity < INITIAL_OUTPUT_CAPACITY) {
+    initial_capacity = INITIAL_OUTPUT_CAPACITY;
+  }
+  *encoded_output = NULL;
+  coder.output = malloc(initial_capacity);
+  if (UNLIKELY(!coder.output)) {
+    return 0;
+  }
+  coder.output_capacity = initial_capacity;
+
+  ByteModel model;
+  if (UNLIKELY(init_byte_model(&model, context_length, length) != 0)) {
+    free(coder.output);
+    return 0;
+  }
+
+  for (size_t i = 0; i < length; i++) {
+    uint8_t byte = data[i];
+
+    // Narrow the range to the byte's cumulative frequency interval
+    uint32_t cumulative_low = byte_model_cumulative(&model, byte);
+    uint32_t cumulative_high = byte_model_cumulative(&model, byte + 1U);
+    uint32_t range = coder.high - coder.low + 1;
+    coder.high = coder.low +
+                 (uint32_t)(((uint64_t)range * cumulative_high) / model.total) -
+                 1;
+    coder.low += (uint32_t)(((uint64_t)range * cumulative_low) / model.total);
+
+    // Renormalization is identical to the bit-level encoder
+    while (1) {
+      if (coder.high < HALF) {
+        output_bit(&coder, 0);
+        output_following_bits(&coder, 1);
+        coder.low <<= 1;
+        coder.high = (coder.high << 1) | 1;
+      } else if (coder.low >= HALF) {
+        output_bit(&coder, 1);
+        output_following_bits(&coder, 0);
+        coder.low = (coder.low - HALF) << 1;
+        coder.high = ((coder.high - HALF) << 1) | 1;
+      } else if (coder.low >= QUARTER && coder.high < THREE_QUARTER) {
+        coder.bits_to_follow++;
+        coder.low = (coder.low - QUARTER) << 1;
+        coder.high = ((coder.high - QUARTER) << 1) | 1;
+      } else {
+        break;
+      }
+    }
+
+    update_byte_model(&model, byte);
+  }
+
+  // Final bits: disambiguate the remaining range
+  coder.bits_to_follow++;
+  if (coder.low < QUARTER) {
+    output_bit(&coder, 0);
+    output_following_bits(&coder, 1);
+  } else {
+    output_bit(&coder, 1);
+    output_following_bits(&coder, 0);
+  }
+  flush_output(&coder);
+
+  free_byte_model(&model);
+
+  *encoded_output = coder.output;
+  return coder.output_size;
+}
+
+// -----------------------------
+// Byte-Level Arithmetic Decoding Function
+// -----------------------------
+
+/**
+ * @brief Decodes a byte sequence produced by arithmetic_encode_bytes.
+ *
+ * @param encoded Pointer to the encoded byte array. (Non-aliasing)
+ * @param encoded_length Length of the encoded data in bytes.
+ * @param decoded Pointer to the buffer where decoded bytes will be stored.
+ * (Non-aliasing)
+ * @param decoded_length Number of bytes to decode.
+ * @param context_length Number of preceding bytes the model adapts to.
+ * @return int 0 on success, -1 if memory could not be allocated.
+ */
+int arithmetic_decode_bytes(const uint8_t *restrict encoded,
+                            size_t encoded_length, uint8_t *restrict decoded,
+                            size_t decoded_length, size_t context_length) {
+  // Precompute constants based on PRECISION
+  const uint32_t TOTAL_FREQUENCY = 1U << PRECISION;
+  const uint32_t HALF = 1U << (PRECISION - 1);
+  const uint32_t QUARTER = 1U << (PRECISION - 2);
+  const uint32_t THREE_QUARTER = 3U << (PRECISION - 2);
+
+  ArithmeticCoder coder = {0};
+  coder.high = TOTAL_FREQUENCY - 1;
+
+  ByteModel model;
+  if (UNLIKELY(init_byte_model(&model, context_length, decoded_length) != 0)) {
+    return -1;
+  }
+
+  size_t bit_index = 0;
+  for (int i = 0; i < PRECISION; i++) {
+    coder.value =
+        (coder.value << 1) | read_bit(encoded, &bit_index, encoded_length);
+  }
+
+  for (size_t i = 0; i < decoded_length; i++) {
+    // Map the value back onto the cumulative frequency scale to find the byte
+    uint32_t range = coder.high - coder.low + 1;
+    uint64_t temp = (uint64_t)(coder.value - coder.low + 1);
+    uint32_t target = (uint32_t)((temp * model.total - 1) / range);
+    uint32_t cumulative_low;
+    uint32_t byte = byte_model_find(&model, target, &cumulative_low);
+    uint32_t cumulative_high = byte_model_cumulative(&model, byte + 1);
+    decoded[i] = (uint8_t)byte;
+
+    coder.high = coder.low +
+                 (uint32_t)(((uint64_t)range * cumulative_high) / model.total) -
+                 1;
+    coder.low += (uint32_t)(((uint64_t)range * cumulative_low) / model.total);
+
+    // Renormalization is identical to the bit-level decoder
+    while (1) {
+      uint32_t offset;
+      if (coder.high < HALF) {
+        offset = 0;
+      } else if (coder.low >= HALF) {
+        offset = HALF;
+      } else if (coder.low >= QUARTER && coder.high < THREE_QUARTER) {
+        offset = QUARTER;
+      } else {
+        break;
+      }
+      coder.value -= offset;
+      coder.low -= offset;
+      coder.high -= offset;
+      coder.low <<= 1;
+      coder.high = (coder.high << 1) | 1;
+      coder.value =
+          (coder.value << 1) | read_bit(encoded, &bit_index, encoded_length);
+    }
+
+    update_byte_model(&model, (uint8_t)byte);
+  }
+
+  free_byte_model(&model);
+  return 0;
 }
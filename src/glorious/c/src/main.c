@@ -29,6 +29,10 @@ int main() {
       arithmetic_encode(&input_bits, input_length, &encoded_data,
                         4,  // Example context length: 4 bits
                         example_get_probability_fixed);
+  if (!encoded_data) {
+    fprintf(stderr, "Encoding failed: out of memory.\n");
+    return 1;
+  }
 
   printf("Encoded data (%zu bytes): ", encoded_size);
   for (size_t i = 0; i < encoded_size; i++) {
@@ -43,9 +47,14 @@ int main() {
   // Initialize decoded_bits to 0
   memset(&decoded_bits, 0, sizeof(decoded_bits));
 
-  arithmetic_decode(encoded_data, encoded_size, &decoded_bits, decoded_length,
-                    4,  // Same context length used in encoding
-                    example_get_probability_fixed);
+  if (arithmetic_decode(encoded_data, encoded_size, &decoded_bits,
+                        decoded_length,
+                        4,  // Same context length used in encoding
+                        example_get_probability_fixed) != 0) {
+    fprintf(stderr, "Decoding failed: out of memory.\n");
+    free(encoded_data);
+    return 1;
+  }
 
   printf("Decoded bit sequence: ");
   print_bits(&decoded_bits, 1);
@@ -0,0 +1,202 @@
+"""Tests for the pure helpers of the autocommit script."""
+
+import importlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Optional
+from unittest import mock
+
+REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+autocommit: Any
+try:
+    # The OpenAI client is created at import time and requires an API key
+    with mock.patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+        autocommit = importlib.import_module("scripts.autocommit")
+except ImportError:  # openai or colorama is not installed
+    autocommit = None
+
+
+def make_completion(*contents: str) -> SimpleNamespace:
+    """Builds a non-streamed chat completion with the given choices."""
+    return SimpleNamespace(
+        choices=[
+            SimpleNamespace(message=SimpleNamespace(content=content))
+            for content in contents
+        ]
+    )
+
+
+@unittest.skipIf(autocommit is None, "autocommit dependencies are not installed")
+class TestScoreCommitMessage(unittest.TestCase):
+    """Test cases for score_commit_message."""
+
+    def test_well_formed_message_scores_highest(self) -> None:
+        """Test that a message following every instruction gets the top score."""
+        message = "Add byte-level coder\n\n- Code one byte per step"
+        self.assertEqual(5, autocommit.score_commit_message(message))
+
+    def test_imperative_verbs_are_not_penalised(self) -> None:
+        """Test imperative verbs that end like past tense or third person."""
+        for summary in ("Embed the model", "Bring back tests", "Seed the RNG"):
+            with self.subTest(summary=summary):
+                self.assertEqual(5, autocommit.score_commit_message(summary))
+        self.assertEqual(5, autocommit.score_commit_message("Focus on speed"))
+
+    def test_non_imperative_verbs_are_penalised(self) -> None:
+        """Test past-tense, gerund and third-person summaries."""
+        for summary in ("Added tests", "Fixing the build", "Updates README"):
+            with self.subTest(summary=summary):
+                self.assertEqual(4, autocommit.score_commit_message(summary))
+
+    def test_formatting_problems_are_penalised(self) -> None:
+        """Test long summaries, markdown and a missing blank line."""
+        self.assertEqual(3, autocommit.score_commit_message("Add " + "x" * 60))
+        self.assertEqual(4, autocommit.score_commit_message("Add **bold** text"))
+        self.assertEqual(4, autocommit.score_commit_message("Add x\nbody"))
+        self.assertEqual(2, autocommit.score_commit_message(""))
+
+
+def make_chunk(index: int, content: Optional[str]) -> SimpleNamespace:
+    """Builds a streamed chunk carrying a delta for a single choice."""
+    delta = SimpleNamespace(content=content)
+    return SimpleNamespace(choices=[SimpleNamespace(index=index, delta=delta)])
+
+
+@unittest.skipIf(autocommit is None, "autocommit dependencies are not installed")
+class TestCollectStreamedCompletions(unittest.TestCase):
+    """Test cases for collect_streamed_completions."""
+
+    def test_interleaved_choices(self) -> None:
+        """Test that interleaved deltas are joined per choice in index order."""
+        chunks = [
+            make_chunk(1, "Fix "),
+            make_chunk(0, "Add "),
+            make_chunk(0, None),
+            make_chunk(1, "y"),
+            make_chunk(0, "x"),
+        ]
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            contents = autocommit.collect_streamed_completions(chunks)
+        self.assertEqual(["Add x", "Fix y"], contents)
+        # Only the first choice is echoed
+        self.assertEqual("Add x\n", stdout.getvalue())
+
+    def test_empty_stream(self) -> None:
+        """Test that a stream without content yields no completions."""
+        with mock.patch("sys.stdout", new_callable=io.StringIO):
+            contents = autocommit.collect_streamed_completions([make_chunk(0, "")])
+        self.assertEqual([], contents)
+
+
+def make_bad_request_error(message: str, param: str) -> Any:
+    """Builds the error the API returns for an invalid request parameter."""
+    return autocommit.openai.BadRequestError(
+        message,
+        response=mock.Mock(status_code=400, headers={}),
+        body={"message": message, "param": param},
+    )
+
+
+@unittest.skipIf(autocommit is None, "autocommit dependencies are not installed")
+class TestGenerateCommitMessages(unittest.TestCase):
+    """Test cases for generate_commit_messages."""
+
+    def test_candidates_are_ranked(self) -> None:
+        """Test that the best-scoring candidate comes first."""
+        completion = make_completion("Added x", "```\nAdd x\n```", "Add y")
+        with mock.patch.object(autocommit, "client") as client:
+            client.chat.completions.create.return_value = completion
+            messages = autocommit.generate_commit_messages(
+                "diff", "", num_candidates=3, stream=False
+            )
+        self.assertEqual(["Add x", "Add y", "Added x"], messages)
+
+    def test_retries_with_single_candidate(self) -> None:
+        """Test falling back to n=1 when the model rejects several choices."""
+        error = make_bad_request_error("Unsupported value: 'n'", param="n")
+        with mock.patch.object(autocommit, "client") as client:
+            client.chat.completions.create.side_effect = [
+                error,
+                make_completion("Add x"),
+            ]
+            messages = autocommit.generate_commit_messages(
+                "diff", "", num_candidates=3, stream=False
+            )
+        self.assertEqual(["Add x"], messages)
+        self.assertEqual(1, client.chat.completions.create.call_args.kwargs["n"])
+
+    def test_other_bad_requests_are_not_retried(self) -> None:
+        """Test that bad requests unrelated to n are raised immediately."""
+        error = make_bad_request_error("context_length_exceeded", param="messages")
+        with mock.patch.object(autocommit, "client") as client:
+            client.chat.completions.create.side_effect = error
+            with self.assertRaises(autocommit.openai.BadRequestError):
+                autocommit.generate_commit_messages(
+                    "diff", "", num_candidates=3, stream=False
+                )
+        self.assertEqual(1, client.chat.completions.create.call_count)
+
+
+@unittest.skipIf(autocommit is None, "autocommit dependencies are not installed")
+class TestCommitMessageCache(unittest.TestCase):
+    """Test cases for the commit message cache."""
+
+    def setUp(self) -> None:
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        patcher = mock.patch.object(
+            autocommit, "COMMIT_MESSAGE_CACHE_DIR", temp_dir.name
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.cache_dir = temp_dir.name
+
+    def test_key_covers_the_request(self) -> None:
+        """Test that the key changes with the repository state and request."""
+        key = autocommit.get_commit_cache_key("head", "tree", False, 1)
+        self.assertEqual(key, autocommit.get_commit_cache_key("head", "tree", False, 1))
+        for other in (
+            ("head2", "tree", False, 1),
+            ("head", "tree2", False, 1),
+            ("head", "tree", True, 1),
+            ("head", "tree", False, 3),
+        ):
+            with self.subTest(other=other):
+                self.assertNotEqual(key, autocommit.get_commit_cache_key(*other))
+        with mock.patch.object(autocommit, "OPENAI_MODEL", "other-model"):
+            self.assertNotEqual(
+                key, autocommit.get_commit_cache_key("head", "tree", False, 1)
+            )
+        with mock.patch.object(autocommit, "COMMIT_MESSAGE_PROMPT", "{diff}"):
+            self.assertNotEqual(
+                key, autocommit.get_commit_cache_key("head", "tree", False, 1)
+            )
+
+    def test_save_and_load(self) -> None:
+        """Test that saved messages are loaded back in order."""
+        autocommit.save_cached_commit_messages("key", ["Add x", "Add y"])
+        self.assertEqual(
+            ["Add x", "Add y"], autocommit.load_cached_commit_messages("key")
+        )
+        self.assertIsNone(autocommit.load_cached_commit_messages("missing"))
+
+    def test_oldest_entries_are_evicted(self) -> None:
+        """Test that saving keeps only the most recent entries."""
+        with mock.patch.object(autocommit, "MAX_CACHED_COMMIT_MESSAGES", 2):
+            for index in range(4):
+                autocommit.save_cached_commit_messages(f"key{index}", ["Add x"])
+                path = os.path.join(self.cache_dir, f"key{index}.json")
+                os.utime(path, (index, index))
+        self.assertEqual(["key2.json", "key3.json"], sorted(os.listdir(self.cache_dir)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 """Tests for the arithmetic coding bindings in the glorious package."""
 
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 import glorious
 
@@ -75,6 +76,136 @@ class TestArithmeticCodingBindings(unittest.TestCase):
         decoded = glorious.decode(encoded, sequence_bit_length, context_length)
         self.assertEqual(sequence, decoded)
 
+    def test_context_register_boundary(self) -> None:
+        """Test round trips around the shift register / ring buffer switch."""
+        sequence = bytes(range(256)) * 4 + b"\x00" * 200 + b"\xff" * 200
+        sequence_bit_length = len(sequence) * 8
+        for context_length in (63, 64, 65):
+            with self.subTest(context_length=context_length):
+                encoded = glorious.encode(sequence, sequence_bit_length, context_length)
+                decoded = glorious.decode(encoded, sequence_bit_length, context_length)
+                self.assertEqual(sequence, decoded)
+
+    def test_context_longer_than_input(self) -> None:
+        """Test bit-level coding with a huge context on a short input."""
+        sequence = b"ab"
+        sequence_bit_length = len(sequence) * 8
+        context_length = 1 << 40
+
+        encoded = glorious.encode(sequence, sequence_bit_length, context_length)
+        decoded = glorious.decode(encoded, sequence_bit_length, context_length)
+        self.assertEqual(sequence, decoded)
+
+        round_trip_encoded, matches = glorious.round_trip(
+            sequence, sequence_bit_length, context_length
+        )
+        self.assertTrue(matches)
+        self.assertEqual(encoded, round_trip_encoded)
+
+    def test_golden_bitstream(self) -> None:
+        """Test that the encoded bitstream matches known-good output."""
+        sequence = b"glorious golden vector"
+        sequence_bit_length = len(sequence) * 8
+        expected = {
+            5: "d51b4e2fc6ecdfda257d4f1841613ef23b8cffdbe51bdf80",
+            100: "fd7c46b7634af8857f899a1994d7b83074fa48f17552082b0ff71b7ef0",
+        }
+        for context_length, encoded_hex in expected.items():
+            with self.subTest(context_length=context_length):
+                encoded = glorious.encode(sequence, sequence_bit_length, context_length)
+                self.assertEqual(bytes.fromhex(encoded_hex), encoded)
+
+    def test_buffer_inputs(self) -> None:
+        """Test encoding and decoding from bytearray and memoryview inputs."""
+        sequence = b"buffer protocol input"
+        sequence_bit_length = len(sequence) * 8
+        context_length = 8
+
+        encoded = glorious.encode(
+            bytearray(sequence), sequence_bit_length, context_length
+        )
+        self.assertEqual(
+            encoded, glorious.encode(sequence, sequence_bit_length, context_length)
+        )
+
+        decoded = glorious.decode(
+            memoryview(encoded), sequence_bit_length, context_length
+        )
+        self.assertEqual(sequence, decoded)
+
+    def test_bit_length_exceeds_sequence(self) -> None:
+        """Test that a bit length longer than the sequence is rejected."""
+        with self.assertRaises(ValueError):
+            glorious.encode(b"ab", 17, 4)
+
+    def test_round_trip(self) -> None:
+        """Test that round_trip matches separate encode and decode calls."""
+        sequence = b"round trip in one call" * 100
+        sequence_bit_length = len(sequence) * 8 - 3
+        context_length = 200
+
+        encoded, matches = glorious.round_trip(
+            sequence, sequence_bit_length, context_length
+        )
+        self.assertTrue(matches)
+        self.assertEqual(
+            encoded, glorious.encode(sequence, sequence_bit_length, context_length)
+        )
+
+        encoded = glorious.encode(
+            sequence, sequence_bit_length, context_length=context_length
+        )
+        decoded = glorious.decode(
+            encoded, decoded_bit_length=sequence_bit_length, context_length=200
+        )
+        self.assertEqual(sequence[:-1], decoded[:-1])
+
+        encoded, matches = glorious.round_trip(
+            sequence, sequence_bit_length=0, context_length=context_length
+        )
+        self.assertTrue(matches)
+        self.assertEqual(encoded, glorious.encode(sequence, 0, context_length))
+
+    def test_byte_symbols(self) -> None:
+        """Test byte-level encoding and decoding across context lengths."""
+        sequence = bytes(range(256)) + b"byte symbols " * 500 + b"\x00" * 300
+        for context_length in (1, 7, 256, 100000):
+            encoded = glorious.encode_bytes(sequence, context_length)
+            self.assertIsInstance(encoded, bytes)
+            decoded = glorious.decode_bytes(encoded, len(sequence), context_length)
+            self.assertEqual(sequence, decoded)
+
+        encoded = glorious.encode_bytes(b"", 8)
+        self.assertEqual(b"", glorious.decode_bytes(encoded, 0, 8))
+        with self.assertRaises(ValueError):
+            glorious.encode_bytes(sequence, 0)
+
+    def test_byte_context_longer_than_input(self) -> None:
+        """Test byte-level coding with a context longer than the input."""
+        sequence = b"short input"
+        max_context_length = (1 << 29) - 256
+
+        encoded = glorious.encode_bytes(sequence, context_length=max_context_length)
+        self.assertEqual(encoded, glorious.encode_bytes(sequence, len(sequence)))
+        decoded = glorious.decode_bytes(
+            encoded, byte_length=len(sequence), context_length=max_context_length
+        )
+        self.assertEqual(sequence, decoded)
+
+    def test_concurrent_threads(self) -> None:
+        """Test encoding and decoding from several threads at once."""
+        sequences = [bytes([i]) * 4096 + b"glorious" for i in range(8)]
+        context_length = 64
+
+        def round_trip(sequence: bytes) -> bytes:
+            bit_length = len(sequence) * 8
+            encoded = glorious.encode(sequence, bit_length, context_length)
+            return glorious.decode(encoded, bit_length, context_length)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            decoded = list(executor.map(round_trip, sequences))
+        self.assertEqual(sequences, decoded)
+
 
 if __name__ == "__main__":
     unittest.main()